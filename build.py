@@ -8,10 +8,36 @@ Usage:
 The output will be in the 'dist' folder.
 """
 
+import json
 import os
+import pprint
 import subprocess
 import sys
 
+FROZEN_DEFAULTS_PATH = os.path.join("src", "winstyles", "core", "_defaults_frozen.py")
+
+
+def generate_frozen_defaults(project_root):
+    """Embed data/defaults/*.json as a Python module so the bundle skips JSON parsing."""
+    defaults_dir = os.path.join(project_root, "data", "defaults")
+    candidates = sorted(
+        name for name in os.listdir(defaults_dir) if name.endswith(".json")
+    ) if os.path.isdir(defaults_dir) else []
+    if not candidates:
+        print("! No defaults database found, skipping frozen defaults")
+        return None
+
+    with open(os.path.join(defaults_dir, candidates[0]), encoding="utf-8") as f:
+        raw = json.load(f)
+
+    output_path = os.path.join(project_root, FROZEN_DEFAULTS_PATH)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(f'"""Generated by build.py from data/defaults/{candidates[0]}. Do not edit."""\n\n')
+        f.write(f"RAW_DEFAULTS = {pprint.pformat(raw, sort_dicts=False)}\n")
+
+    print(f"✓ Frozen defaults generated: {FROZEN_DEFAULTS_PATH}")
+    return output_path
+
 
 def main():
     print("=" * 50)
@@ -41,11 +67,19 @@ def main():
     print("Building executable...")
     print("-" * 50)
 
+    # Embed defaults database (picked up by collect_submodules in the spec)
+    frozen_defaults = generate_frozen_defaults(project_root)
+
     # Run PyInstaller
-    result = subprocess.run(
-        [sys.executable, "-m", "PyInstaller", "--clean", spec_file],
-        cwd=project_root
-    )
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "PyInstaller", "--clean", spec_file],
+            cwd=project_root
+        )
+    finally:
+        # Remove generated module so dev runs keep reading the JSON source
+        if frozen_defaults and os.path.exists(frozen_defaults):
+            os.remove(frozen_defaults)
 
     if result.returncode == 0:
         print()
@@ -1,9 +1,37 @@
 """
 核心业务层 - 纯逻辑，无副作用
+
+导出对象按需加载 (PEP 562)：导入 winstyles.core 本身不会引入引擎与全部扫描器插件。
 """
 
-from winstyles.core.analyzer import DiffAnalyzer
-from winstyles.core.context import AppContext
-from winstyles.core.engine import StyleEngine
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from winstyles.core.analyzer import DiffAnalyzer
+    from winstyles.core.context import AppContext
+    from winstyles.core.engine import StyleEngine
 
 __all__ = ["StyleEngine", "DiffAnalyzer", "AppContext"]
+
+# 导出名 -> 所在子模块
+_LAZY_EXPORTS = {
+    "StyleEngine": "winstyles.core.engine",
+    "DiffAnalyzer": "winstyles.core.analyzer",
+    "AppContext": "winstyles.core.context",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
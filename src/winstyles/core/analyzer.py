@@ -8,6 +8,18 @@ from winstyles.domain.models import ScannedItem
 from winstyles.domain.types import ChangeType
 
 
+def _change_type(current_value: Any, default_value: Any) -> ChangeType:
+    """根据当前值与默认值判定变更类型"""
+    if default_value is None:
+        # 默认值库中不存在此项，视为新增
+        return ChangeType.ADDED
+    if current_value == default_value:
+        # 与默认值相同
+        return ChangeType.DEFAULT
+    # 已修改
+    return ChangeType.MODIFIED
+
+
 class DiffAnalyzer:
     """
     差异分析器
@@ -22,6 +34,14 @@ class DiffAnalyzer:
             defaults_db: 默认值数据库
         """
         self._defaults = defaults_db
+        # 预先展平为 {(category, key): default}，逐项对比时只需一次字典查找
+        self._flat_defaults: dict[tuple[str, str], Any] = {
+            (category, key): value
+            for category, category_defaults in defaults_db.items()
+            if isinstance(category_defaults, dict)
+            for key, value in category_defaults.items()
+        }
+        self._known_categories = frozenset(defaults_db)
 
     @classmethod
     def compare(
@@ -39,8 +59,32 @@ class DiffAnalyzer:
         Returns:
             标记了变更类型的配置项列表
         """
-        analyzer = cls(defaults_db)
-        return [analyzer.analyze_item(item) for item in items]
+        return cls(defaults_db).analyze_items(items)
+
+    def analyze_items(self, items: list[ScannedItem]) -> list[ScannedItem]:
+        """
+        批量分析配置项（分析器可复用，避免每次重新展平默认值库）
+
+        Args:
+            items: 扫描到的配置项列表
+
+        Returns:
+            标记了变更类型的配置项列表
+        """
+        # 与 analyze_item 逻辑一致，内联以省去逐项方法调用与类别检查
+        get_default = self._flat_defaults.get
+        result: list[ScannedItem] = []
+        for item in items:
+            default_value = get_default((item.category, item.key))
+            result.append(
+                item.model_copy(
+                    update={
+                        "default_value": default_value,
+                        "change_type": _change_type(item.current_value, default_value),
+                    }
+                )
+            )
+        return result
 
     def analyze_item(self, item: ScannedItem) -> ScannedItem:
         """
@@ -54,21 +98,11 @@ class DiffAnalyzer:
         """
         default_value = self._get_default_value(item.category, item.key)
 
-        if default_value is None:
-            # 默认值库中不存在此项，视为新增
-            change_type = ChangeType.ADDED
-        elif item.current_value == default_value:
-            # 与默认值相同
-            change_type = ChangeType.DEFAULT
-        else:
-            # 已修改
-            change_type = ChangeType.MODIFIED
-
         # 创建更新后的项（Pydantic model 是不可变的，需要 copy）
         return item.model_copy(
             update={
                 "default_value": default_value,
-                "change_type": change_type,
+                "change_type": _change_type(item.current_value, default_value),
             }
         )
 
@@ -83,5 +117,6 @@ class DiffAnalyzer:
         Returns:
             默认值，如果不存在则返回 None
         """
-        category_defaults = self._defaults.get(category, {})
-        return category_defaults.get(key)
+        if category not in self._known_categories:
+            return None
+        return self._flat_defaults.get((category, key))
@@ -3,6 +3,7 @@ AppContext - 运行时上下文，管理全局配置和服务
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar, Optional
@@ -24,9 +25,20 @@ class AppConfig:
     # 是否启用详细输出
     verbose: bool = False
 
-    def __post_init__(self) -> None:
-        # 确保数据目录存在
+    # 扫描并发线程数（<= 1 时顺序执行）
+    concurrency: int = 4
+
+    def ensure_data_dir(self) -> Path:
+        """
+        确保数据目录存在（仅在需要写入时调用，构造配置时不创建目录）
+
+        写入数据目录的代码（如 UpdateChecker 的 http_cache）统一通过此方法获取目录。
+
+        Returns:
+            数据目录路径
+        """
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        return self.data_dir
 
 
 class AppContext:
@@ -40,23 +52,30 @@ class AppContext:
     """
 
     _instance: ClassVar[Optional["AppContext"]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
     _initialized: bool
     _config: AppConfig
     _logger: logging.Logger
 
     def __new__(cls, config: AppConfig | None = None) -> "AppContext":
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self, config: AppConfig | None = None) -> None:
         if self._initialized:
             return
 
-        self._config = config or AppConfig()
-        self._logger = self._setup_logger()
-        self._initialized = True
+        with self._lock:
+            if self._initialized:
+                return
+            self._config = config or AppConfig()
+            self._logger = self._setup_logger()
+            self._initialized = True
 
     @property
     def config(self) -> AppConfig:
@@ -73,16 +92,20 @@ class AppContext:
         logger = logging.getLogger("wss")
         logger.setLevel(getattr(logging, self._config.log_level.upper()))
 
-        # 控制台处理器
-        handler = logging.StreamHandler()
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        logger.addHandler(handler)
+        # 控制台处理器（重复初始化时不再追加，避免日志重复输出）
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(
+                logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+            )
+            logger.addHandler(handler)
+        logger.propagate = False
 
         return logger
 
     @classmethod
     def reset(cls) -> None:
         """重置上下文（主要用于测试）"""
-        cls._instance = None
+        with cls._lock:
+            cls._instance = None
+            logging.getLogger("wss").handlers.clear()
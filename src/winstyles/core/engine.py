@@ -4,20 +4,29 @@ StyleEngine - 核心引擎，负责调度扫描器和管理工作流
 
 from __future__ import annotations
 
-import json
+import importlib
+import logging
 import os
 import platform
 import shutil
+import struct
+import sys
 import tempfile
 import zipfile
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
 from winstyles.core.analyzer import DiffAnalyzer
+from winstyles.core.context import AppContext
+from winstyles.core.exceptions import ScanError
 from winstyles.domain.models import ExportOptions, Manifest, ScannedItem, ScanResult, SourceSystem
-from winstyles.domain.types import AssetType
-from winstyles.infra.filesystem import WindowsFileSystemAdapter
-from winstyles.infra.registry import WindowsRegistryAdapter
+from winstyles.domain.types import AssetType, SourceType
+from winstyles.infra.filesystem import IFileSystemAdapter, WindowsFileSystemAdapter
+from winstyles.infra.registry import IRegistryAdapter, WindowsRegistryAdapter
 from winstyles.infra.restore import RestorePointManager
 from winstyles.infra.system import SystemAPI
 from winstyles.plugins.base import BaseScanner
@@ -35,6 +44,370 @@ from winstyles.plugins.terminal import (
 from winstyles.plugins.theme import ThemeScanner
 from winstyles.plugins.vscode import VSCodeScanner
 from winstyles.plugins.wallpaper import WallpaperScanner
+from winstyles.utils import jsonio
+
+ScannerFactory = Callable[[], BaseScanner]
+
+# 默认值数据库目录：打包模式下位于 PyInstaller 解包目录，否则位于仓库根目录
+if getattr(sys, "frozen", False):
+    _DEFAULTS_DIR = Path(getattr(sys, "_MEIPASS")) / "data" / "defaults"
+else:
+    _DEFAULTS_DIR = Path(__file__).resolve().parents[3] / "data" / "defaults"
+
+# build.py 构建时生成的默认值模块（内嵌原始 JSON 数据），开发模式下不存在
+_FROZEN_DEFAULTS_MODULE = "winstyles.core._defaults_frozen"
+
+
+_MISSING = object()
+
+# DWM 颜色（ABGR DWORD）转换
+_pack_uint32_le = struct.Struct("<I").pack
+_HEX_PREFIXES = frozenset({"0x", "0X"})
+
+# 默认值 JSON 展平规则：(类别, 原始路径, 目标键, 规整方法名)
+# 目标键为 None 时整体合并该字典；含 "{}" 时按子键（转小写）展开
+_FLATTEN_SCHEMA: tuple[tuple[str, tuple[str, ...], str | None, str | None], ...] = (
+    ("fonts", ("fonts", "substitutes"), None, None),
+    ("fonts", ("fonts", "font_link"), None, None),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "default_profile"),
+        "windowsTerminal.defaultProfile",
+        None,
+    ),
+    ("terminal", ("terminal", "windows_terminal", "theme"), "windowsTerminal.theme", None),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "use_acrylic"),
+        "windowsTerminal.useAcrylicInTabRow",
+        None,
+    ),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "font_face"),
+        "windowsTerminal.defaults.font.face",
+        None,
+    ),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "font_size"),
+        "windowsTerminal.defaults.font.size",
+        None,
+    ),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "use_acrylic"),
+        "windowsTerminal.defaults.useAcrylic",
+        None,
+    ),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "font_face"),
+        "windowsTerminal.defaults.fontFace",
+        None,
+    ),
+    (
+        "terminal",
+        ("terminal", "windows_terminal", "font_size"),
+        "windowsTerminal.defaults.fontSize",
+        None,
+    ),
+    ("theme", ("theme", "appsUseLightTheme"), "theme.appsUseLightTheme", None),
+    ("theme", ("theme", "systemUsesLightTheme"), "theme.systemUsesLightTheme", None),
+    ("theme", ("theme", "enableTransparency"), "theme.enableTransparency", None),
+    ("theme", ("theme", "colorPrevalence"), "theme.colorPrevalence", None),
+    ("theme", ("theme", "accentColor"), "theme.accentColor", None),
+    (
+        "theme",
+        ("appearance", "colorization_color"),
+        "theme.dwm.colorizationColor",
+        "_normalize_dwm_color_default",
+    ),
+    (
+        "theme",
+        ("appearance", "colorization_color_balance"),
+        "theme.dwm.colorizationColorBalance",
+        None,
+    ),
+    (
+        "theme",
+        ("appearance", "colorization_afterglow"),
+        "theme.dwm.colorizationAfterglow",
+        "_normalize_dwm_color_default",
+    ),
+    (
+        "theme",
+        ("appearance", "colorization_afterglow_balance"),
+        "theme.dwm.colorizationAfterglowBalance",
+        None,
+    ),
+    (
+        "theme",
+        ("appearance", "colorization_blur_balance"),
+        "theme.dwm.colorizationBlurBalance",
+        None,
+    ),
+    (
+        "theme",
+        ("appearance", "accent_color_inactive"),
+        "theme.dwm.accentColorInactive",
+        "_normalize_dwm_color_default",
+    ),
+    ("wallpaper", ("wallpaper", "style"), "wallpaper.style", None),
+    ("wallpaper", ("wallpaper", "tile"), "wallpaper.tile", None),
+    ("cursor", ("cursor", "scheme"), "cursor.scheme", None),
+    ("cursor", ("cursor", "cursors"), "cursor.{}", "_normalize_default_cursor_path"),
+)
+
+
+def _read_defaults_file() -> Any:
+    """
+    读取 data/defaults 下（按文件名排序的）第一个默认值 JSON，失败时返回 None
+
+    解析结果按 (路径, mtime, 大小) 在进程内缓存：多次创建 StyleEngine 时不再重复解析，
+    文件被修改后自动失效。
+    """
+    try:
+        with os.scandir(_DEFAULTS_DIR) as entries:
+            candidates = {
+                entry.name: entry
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+        if not candidates:
+            return None
+        entry = candidates[min(candidates)]
+        stat = entry.stat()
+    except OSError:
+        return None
+    return _parse_defaults_file(entry.path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_defaults_file(path: str, mtime_ns: int, size: int) -> Any:
+    """解析默认值 JSON；mtime_ns/size 仅作为缓存键，失败时返回 None"""
+    try:
+        with open(path, "rb") as f:
+            return jsonio.loads(f.read())
+    except (OSError, jsonio.JSONDecodeError):
+        return None
+
+
+def _as_path(path: str | os.PathLike[str]) -> Path:
+    """公开入口的路径参数统一转为 Path，已是 Path 时直接返回"""
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _dig(data: Any, path: tuple[str, ...]) -> Any:
+    """按路径逐层取值，任一层不是字典或缺少键时返回 _MISSING"""
+    for part in path:
+        if not isinstance(data, dict) or part not in data:
+            return _MISSING
+        data = data[part]
+    return data
+
+
+def _open_package_zip(output_path: Path) -> zipfile.ZipFile:
+    """创建用于写入配置包的 zip 文件（必要时创建父目录）"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # strict_timestamps=False：早于 1980 年的文件时间戳（如部分旧字体）会被钳制而不是报错
+    return zipfile.ZipFile(
+        output_path,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        strict_timestamps=False,
+    )
+
+
+# 已压缩格式直接存储，避免对几乎无法再压缩的数据做 deflate。
+# .ttf/.ttc/.otf、.cur/.ani 与 .ico/.bmp 多为未压缩的表或位图，deflate 仍能明显减小体积，保持压缩
+_ZIP_STORED_SUFFIXES = frozenset(
+    {
+        # 图片
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".jfif",
+        ".gif",
+        ".webp",
+        ".heic",
+        ".avif",
+        # Web 字体
+        ".woff",
+        ".woff2",
+        # 压缩包
+        ".zip",
+        ".gz",
+        ".7z",
+    }
+)
+# 文本数据使用快速压缩级别，体积接近默认级别但耗时显著更低
+_ZIP_FAST_SUFFIXES = frozenset({".json"})
+# 写入 zip 时的文件读取块大小
+_ZIP_COPY_BUFFER = 1024 * 1024
+
+
+def _iter_scan_json(scan_result: ScanResult) -> Iterator[bytes]:
+    """
+    分段序列化 scan.json，拼接结果与 jsonio.dumps(scan_result.model_dump(mode="json")) 一致
+
+    配置项逐个转换与序列化，不再先构建整份扫描结果的字典，峰值内存约为单个配置项的大小。
+    JSON 字符串内的换行均已转义，按行追加缩进即可嵌入外层结构。
+    """
+    header = scan_result.model_dump(mode="json", exclude={"items"})
+    separator = b"{\n  "
+    for name in ScanResult.model_fields:
+        yield separator + jsonio.dumps(name) + b": "
+        separator = b",\n  "
+        if name != "items":
+            yield jsonio.dumps(header[name]).replace(b"\n", b"\n  ")
+            continue
+        if not scan_result.items:
+            yield b"[]"
+            continue
+        item_separator = b"[\n    "
+        for item in scan_result.items:
+            yield item_separator
+            yield jsonio.dumps(item.model_dump(mode="json")).replace(b"\n", b"\n    ")
+            item_separator = b",\n    "
+        yield b"\n  ]"
+    yield b"\n}"
+
+
+@lru_cache(maxsize=8)
+def _read_scan_bytes_cached(package_path: str, mtime_ns: int, size: int) -> bytes | None:
+    """
+    读取配置包中 scan.json 的原始字节
+
+    mtime_ns/size 取自 scan.json（目录包）或 zip 文件本身，仅作为缓存键：
+    同一配置包反复加载时跳过文件读取与 zip 解压，文件变化后自动失效。
+    缓存不可变的字节串而非模型对象，每次加载都重新构建 ScanResult，调用方修改结果不会影响缓存。
+    """
+    try:
+        with _PackageReader(Path(package_path)) as reader:
+            return reader.read_bytes("scan.json")
+    except OSError:
+        return None
+
+
+def _zip_compression_for(suffix: str) -> tuple[int, int | None]:
+    """按扩展名选择 (压缩方式, 压缩级别)，级别为 None 时使用 zlib 默认值"""
+    suffix = suffix.lower()
+    if suffix in _ZIP_STORED_SUFFIXES:
+        return zipfile.ZIP_STORED, None
+    if suffix in _ZIP_FAST_SUFFIXES:
+        return zipfile.ZIP_DEFLATED, 1
+    return zipfile.ZIP_DEFLATED, None
+
+
+def _zip_write_file(zip_ref: zipfile.ZipFile, file_path: str | Path, arcname: str) -> None:
+    """
+    按扩展名选择压缩方式，将单个文件写入 zip
+
+    与 ZipFile.write 相同，但以 1 MB 块复制（标准库固定为 8 KB），减少大资产的循环次数。
+    """
+    compress_type, compresslevel = _zip_compression_for(os.path.splitext(arcname)[1])
+    if compresslevel is not None:
+        # 压缩级别只能经由 ZipFile.write/writestr 传入；需要指定级别的都是小文本文件
+        zip_ref.write(file_path, arcname, compress_type=compress_type, compresslevel=compresslevel)
+        return
+    info = zipfile.ZipInfo.from_file(file_path, arcname, strict_timestamps=False)
+    info.compress_type = compress_type
+    with open(file_path, "rb") as src, zip_ref.open(info, "w") as dest:
+        shutil.copyfileobj(src, dest, _ZIP_COPY_BUFFER)
+
+
+# Python 3.12 起 shutil.copy2 在 Windows 上已改用系统 CopyFile2，更早版本仍是 Python 层读写循环
+_USE_NATIVE_COPY = sys.platform == "win32" and sys.version_info < (3, 12)
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """复制文件并保留元数据，优先交给系统完成复制"""
+    if _USE_NATIVE_COPY and SystemAPI.copy_file(str(src), str(dst)):
+        return
+    shutil.copy2(src, dst)
+
+
+def _is_same_copy(src_stat: os.stat_result, dst: Path) -> bool:
+    """目标文件存在且大小、修改时间与源一致时返回 True"""
+    try:
+        dst_stat = dst.stat()
+    except OSError:
+        return False
+    return dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+
+# 导入操作类型（按配置来源分派）
+_IMPORT_OPERATION_BY_SOURCE: dict[SourceType, str] = {
+    SourceType.REGISTRY: "set_registry_value",
+    SourceType.FILE: "write_file",
+    SourceType.SYSTEM_API: "invoke_system_api",
+}
+
+# 当前值即资产路径的扫描项（导入时随资产重定位一起改写）
+_ASSET_PATH_VALUE_KEYS = frozenset({"wallpaper.path", "wallpaper.transcoded"})
+
+# 写入注册表时视为高风险的系统外观类别
+_APPEARANCE_CATEGORIES = frozenset({"fonts", "theme", "cursor", "wallpaper"})
+
+
+def _is_readonly(item: ScannedItem) -> bool:
+    """扫描项是否标记为只读（仅接受布尔 True）"""
+    return item.metadata.get("readonly") is True
+
+
+def _instance_factory(scanner: BaseScanner) -> ScannerFactory:
+    """将已有扫描器实例包装为工厂"""
+
+    def factory() -> BaseScanner:
+        return scanner
+
+    return factory
+
+
+def _check_scanner_key(key: str) -> None:
+    """
+    校验扫描器注册键为 "category.id" 格式
+
+    按类别筛选扫描器时取键中第一个 "." 之前的部分作为类别，格式不符会导致扫描器无法被选中。
+
+    Raises:
+        ValueError: 类别或 id 为空
+    """
+    category, _, scanner_id = key.partition(".")
+    if not category or not scanner_id:
+        raise ValueError(f"扫描器注册键格式应为 category.id，实际为 {key!r}")
+
+
+class _PackageReader:
+    """配置包读取器：统一目录与 zip 两种形式，zip 在上下文内只打开一次"""
+
+    def __init__(self, package_path: Path) -> None:
+        self._path = package_path
+        self._zip: zipfile.ZipFile | None = None
+
+    def __enter__(self) -> _PackageReader:
+        if self._path.suffix.lower() == ".zip":
+            self._zip = zipfile.ZipFile(self._path, "r")
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def read_bytes(self, name: str) -> bytes | None:
+        """读取包内文件内容，不存在时返回 None"""
+        if self._zip is not None:
+            try:
+                return self._zip.read(name)
+            except KeyError:
+                return None
+
+        file_path = self._path / name
+        if not file_path.is_file():
+            return None
+        return file_path.read_bytes()
 
 
 class StyleEngine:
@@ -47,159 +420,128 @@ class StyleEngine:
     - 加载默认值数据库
     """
 
-    def __init__(self) -> None:
-        self._scanners: list[BaseScanner] = []
-        self._defaults_db: dict[str, Any] = {}
-        self._defaults_os_version = ""
+    def __init__(self, ctx: AppContext | None = None) -> None:
+        """
+        Args:
+            ctx: 运行时上下文，None 表示首次使用时取全局 AppContext
+        """
+        if ctx is not None:
+            self._ctx = ctx
+        # 扫描器按 "category.id" 注册为工厂，首次使用时才实例化
+        self._scanner_factories: dict[str, ScannerFactory] = {}
+        self._scanner_cache: dict[str, BaseScanner] = {}
+        # category -> 注册键列表，导入时按类别查找扫描器用，注册变更时失效
+        self._category_index: dict[str, list[str]] | None = None
         self._load_plugins()
-        self._load_defaults()
+
+    @cached_property
+    def _ctx(self) -> AppContext:
+        return AppContext()
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return self._ctx.logger
+
+    @cached_property
+    def _registry(self) -> IRegistryAdapter:
+        return WindowsRegistryAdapter()
+
+    @cached_property
+    def _fs(self) -> IFileSystemAdapter:
+        return WindowsFileSystemAdapter()
 
     def _load_plugins(self) -> None:
-        """动态加载所有扫描器插件"""
-        registry = WindowsRegistryAdapter()
-        fs = WindowsFileSystemAdapter()
-        # 字体扫描器
-        self.register_scanner(FontSubstitutesScanner(registry, fs))
-        self.register_scanner(FontLinkScanner(registry, fs))
-        self.register_scanner(InstalledFontsScanner(registry, fs))
-        # 终端扫描器
-        self.register_scanner(WindowsTerminalScanner(registry, fs))
-        self.register_scanner(PowerShellProfileScanner(registry, fs))
-        self.register_scanner(OhMyPoshScanner(registry, fs))
-        # 主题扫描器
-        self.register_scanner(ThemeScanner(registry, fs))
-        # 壁纸扫描器
-        self.register_scanner(WallpaperScanner(registry, fs))
-        # 鼠标指针扫描器
-        self.register_scanner(CursorScanner(registry, fs))
-        # VS Code 扫描器
-        self.register_scanner(VSCodeScanner(registry, fs))
-
-    def _load_defaults(self) -> None:
+        """注册所有扫描器插件（仅登记工厂，不立即实例化）"""
+        builtin: list[tuple[str, type[BaseScanner]]] = [
+            # 字体扫描器
+            ("fonts.font_substitutes", FontSubstitutesScanner),
+            ("fonts.font_link", FontLinkScanner),
+            ("fonts.installed_fonts", InstalledFontsScanner),
+            # 终端扫描器
+            ("terminal.windows_terminal", WindowsTerminalScanner),
+            ("terminal.powershell_profile", PowerShellProfileScanner),
+            ("terminal.oh_my_posh", OhMyPoshScanner),
+            # 主题扫描器
+            ("theme.theme", ThemeScanner),
+            # 壁纸扫描器
+            ("wallpaper.wallpaper", WallpaperScanner),
+            # 鼠标指针扫描器
+            ("cursor.cursor", CursorScanner),
+            # VS Code 扫描器
+            ("vscode.vscode", VSCodeScanner),
+        ]
+        for key, scanner_cls in builtin:
+            self.register_scanner(self._builtin_factory(scanner_cls), key=key)
+
+    def _builtin_factory(self, scanner_cls: type[BaseScanner]) -> ScannerFactory:
+        def factory() -> BaseScanner:
+            return scanner_cls(self._registry, self._fs)
+
+        return factory
+
+    @cached_property
+    def _defaults(self) -> tuple[str, dict[str, dict[str, Any]]]:
+        """默认值数据库 (os_version, {category: {key: value}})，首次访问时加载"""
+        return self._load_defaults()
+
+    @property
+    def defaults_db(self) -> dict[str, dict[str, Any]]:
+        """Windows 默认值数据库"""
+        return self._defaults[1]
+
+    @cached_property
+    def _analyzer(self) -> DiffAnalyzer | None:
+        """基于默认值数据库的差异分析器，多次扫描复用；无默认值库时为 None"""
+        defaults_db = self.defaults_db
+        return DiffAnalyzer(defaults_db) if defaults_db else None
+
+    @property
+    def _defaults_os_version(self) -> str:
+        return self._defaults[0]
+
+    def _load_defaults(self) -> tuple[str, dict[str, dict[str, Any]]]:
         """加载 Windows 默认值数据库"""
-        defaults_dir = Path(__file__).resolve().parents[3] / "data" / "defaults"
-        if not defaults_dir.exists():
-            self._defaults_db = {}
-            return
+        raw = self._load_frozen_defaults()
+        if raw is None:
+            raw = _read_defaults_file()
+        if not isinstance(raw, dict):
+            return "", {}
 
-        candidates = sorted(defaults_dir.glob("*.json"))
-        if not candidates:
-            self._defaults_db = {}
-            return
+        # 展开环境变量等规整步骤与本机相关，始终在运行时执行
+        return str(raw.get("os_version", "")).strip(), self._flatten_defaults(raw)
 
-        default_file = candidates[0]
+    def _load_frozen_defaults(self) -> Any:
+        """读取构建时内嵌的默认值数据，不存在时返回 None"""
         try:
-            raw = json.loads(default_file.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            self._defaults_db = {}
-            return
-
-        self._defaults_os_version = str(raw.get("os_version", "")).strip()
-        self._defaults_db = self._flatten_defaults(raw)
+            module = importlib.import_module(_FROZEN_DEFAULTS_MODULE)
+        except ImportError:
+            return None
+        return getattr(module, "RAW_DEFAULTS", None)
 
     def _flatten_defaults(self, raw: dict[str, Any]) -> dict[str, dict[str, Any]]:
         """将默认值 JSON 规整为 {category: {key: value}} 结构"""
         defaults: dict[str, dict[str, Any]] = {}
 
-        fonts = raw.get("fonts", {})
-        if isinstance(fonts, dict):
-            font_defaults: dict[str, Any] = {}
-            substitutes = fonts.get("substitutes", {})
-            if isinstance(substitutes, dict):
-                font_defaults.update(substitutes)
-            font_link = fonts.get("font_link", {})
-            if isinstance(font_link, dict):
-                font_defaults.update(font_link)
-            if font_defaults:
-                defaults["fonts"] = font_defaults
-
-        terminal = raw.get("terminal", {})
-        if isinstance(terminal, dict):
-            wt = terminal.get("windows_terminal", {})
-            if isinstance(wt, dict):
-                terminal_defaults: dict[str, Any] = {}
-                key_map = {
-                    "default_profile": "windowsTerminal.defaultProfile",
-                    "theme": "windowsTerminal.theme",
-                    "use_acrylic": "windowsTerminal.useAcrylicInTabRow",
-                    "font_face": "windowsTerminal.defaults.font.face",
-                    "font_size": "windowsTerminal.defaults.font.size",
-                }
-                for src_key, dest_key in key_map.items():
-                    if src_key in wt:
-                        terminal_defaults[dest_key] = wt[src_key]
-                if "use_acrylic" in wt:
-                    terminal_defaults["windowsTerminal.defaults.useAcrylic"] = wt["use_acrylic"]
-                if "font_face" in wt:
-                    terminal_defaults["windowsTerminal.defaults.fontFace"] = wt["font_face"]
-                if "font_size" in wt:
-                    terminal_defaults["windowsTerminal.defaults.fontSize"] = wt["font_size"]
-                if terminal_defaults:
-                    defaults["terminal"] = terminal_defaults
-
-        theme = raw.get("theme", {})
-        appearance = raw.get("appearance", {})
-        theme_defaults: dict[str, Any] = {}
-        if isinstance(theme, dict):
-            theme_map = {
-                "appsUseLightTheme": "theme.appsUseLightTheme",
-                "systemUsesLightTheme": "theme.systemUsesLightTheme",
-                "enableTransparency": "theme.enableTransparency",
-                "colorPrevalence": "theme.colorPrevalence",
-                "accentColor": "theme.accentColor",
-            }
-            for src_key, dest_key in theme_map.items():
-                if src_key in theme:
-                    theme_defaults[dest_key] = theme[src_key]
-        if isinstance(appearance, dict):
-            appearance_map = {
-                "colorization_color": "theme.dwm.colorizationColor",
-                "colorization_color_balance": "theme.dwm.colorizationColorBalance",
-                "colorization_afterglow": "theme.dwm.colorizationAfterglow",
-                "colorization_afterglow_balance": "theme.dwm.colorizationAfterglowBalance",
-                "colorization_blur_balance": "theme.dwm.colorizationBlurBalance",
-                "accent_color_inactive": "theme.dwm.accentColorInactive",
-            }
-            color_keys = {
-                "colorization_color",
-                "colorization_afterglow",
-                "accent_color_inactive",
-            }
-            for src_key, dest_key in appearance_map.items():
-                if src_key in appearance:
-                    value = appearance[src_key]
-                    if src_key in color_keys:
-                        value = self._normalize_dwm_color_default(value)
-                    theme_defaults[dest_key] = value
-        if theme_defaults:
-            defaults["theme"] = theme_defaults
-
-        wallpaper = raw.get("wallpaper", {})
-        if isinstance(wallpaper, dict):
-            wallpaper_defaults: dict[str, Any] = {}
-            if "style" in wallpaper:
-                wallpaper_defaults["wallpaper.style"] = wallpaper["style"]
-            if "tile" in wallpaper:
-                wallpaper_defaults["wallpaper.tile"] = wallpaper["tile"]
-            if wallpaper_defaults:
-                defaults["wallpaper"] = wallpaper_defaults
-
-        cursor = raw.get("cursor", {})
-        if isinstance(cursor, dict):
-            cursor_defaults: dict[str, Any] = {}
-            if "scheme" in cursor:
-                cursor_defaults["cursor.scheme"] = cursor["scheme"]
-
-            cursors = cursor.get("cursors", {})
-            if isinstance(cursors, dict):
-                for key, value in cursors.items():
-                    cursor_defaults[f"cursor.{str(key).lower()}"] = (
-                        self._normalize_default_cursor_path(value)
-                    )
-            if cursor_defaults:
-                defaults["cursor"] = cursor_defaults
+        for category, raw_path, dest_key, normalizer_name in _FLATTEN_SCHEMA:
+            value = _dig(raw, raw_path)
+            if value is _MISSING:
+                continue
+            normalizer = getattr(self, normalizer_name) if normalizer_name else None
+
+            if dest_key is None or "{}" in dest_key:
+                # 整体展开字典：None 保留原键，含 "{}" 时按模板生成小写键
+                if not isinstance(value, dict):
+                    continue
+                target = defaults.setdefault(category, {})
+                for key, item in value.items():
+                    out_key = key if dest_key is None else dest_key.format(str(key).lower())
+                    target[out_key] = normalizer(item) if normalizer else item
+            else:
+                target = defaults.setdefault(category, {})
+                target[dest_key] = normalizer(value) if normalizer else value
 
-        return defaults
+        # 与旧实现保持一致：不输出空类别
+        return {category: values for category, values in defaults.items() if values}
 
     def _normalize_default_cursor_path(self, raw_value: Any) -> Any:
         if not isinstance(raw_value, str):
@@ -215,7 +557,7 @@ class StyleEngine:
             return self._abgr_to_hex(raw_value)
         if isinstance(raw_value, str):
             text = raw_value.strip()
-            if text.startswith("0x"):
+            if text[:2] in _HEX_PREFIXES:
                 try:
                     return self._abgr_to_hex(int(text, 16))
                 except ValueError:
@@ -225,39 +567,103 @@ class StyleEngine:
         return raw_value
 
     def _abgr_to_hex(self, value: int) -> str:
-        r = value & 0xFF
-        g = (value >> 8) & 0xFF
-        b = (value >> 16) & 0xFF
-        return f"#{r:02X}{g:02X}{b:02X}"
+        # 小端打包后前三个字节即 R、G、B
+        return "#" + _pack_uint32_le(value & 0xFFFFFF)[:3].hex().upper()
+
+    def register_scanner(
+        self,
+        scanner: BaseScanner | ScannerFactory,
+        key: str | None = None,
+    ) -> None:
+        """
+        注册一个扫描器
 
-    def register_scanner(self, scanner: BaseScanner) -> None:
-        """注册一个扫描器"""
-        self._scanners.append(scanner)
+        Args:
+            scanner: 扫描器实例，或返回扫描器实例的工厂函数
+            key: 注册键，格式为 "category.id"；传入工厂函数时必填，
+                传入实例时省略则按扫描器的 category 与 id 生成
 
-    def scan_all(self, categories: list[str] | None = None) -> ScanResult:
+        Raises:
+            ValueError: key 缺失、格式不符，或与扫描器实例的 category 不一致
+        """
+        if isinstance(scanner, BaseScanner):
+            key = key or f"{scanner.category}.{scanner.id}"
+            _check_scanner_key(key)
+            if key.partition(".")[0] != scanner.category:
+                raise ValueError(f"扫描器注册键 {key!r} 与扫描器类别 {scanner.category!r} 不一致")
+            self._scanner_factories[key] = _instance_factory(scanner)
+            self._scanner_cache[key] = scanner
+            self._category_index = None
+            return
+
+        if not key:
+            raise ValueError("注册扫描器工厂时必须提供 key（格式: category.id）")
+        _check_scanner_key(key)
+        self._scanner_factories[key] = scanner
+        self._scanner_cache.pop(key, None)
+        self._category_index = None
+
+    def _get_scanner(self, key: str) -> BaseScanner:
+        """按注册键获取扫描器，首次访问时实例化并缓存"""
+        scanner = self._scanner_cache.get(key)
+        if scanner is None:
+            scanner = self._scanner_factories[key]()
+            self._scanner_cache[key] = scanner
+        return scanner
+
+    @property
+    def _scanners(self) -> list[BaseScanner]:
+        """全部扫描器（会实例化所有尚未创建的扫描器）"""
+        return [self._get_scanner(key) for key in self._scanner_factories]
+
+    @_scanners.setter
+    def _scanners(self, scanners: list[BaseScanner]) -> None:
+        self._scanner_factories = {}
+        self._scanner_cache = {}
+        self._category_index = None
+        for index, scanner in enumerate(scanners):
+            key = f"{scanner.category}.{index}"
+            self._scanner_factories[key] = _instance_factory(scanner)
+            self._scanner_cache[key] = scanner
+
+    def _scanners_for_category(self, category: str) -> list[BaseScanner]:
+        """获取指定类别的扫描器（按注册顺序，仅实例化该类别）"""
+        if self._category_index is None:
+            index: dict[str, list[str]] = {}
+            for key in self._scanner_factories:
+                index.setdefault(key.partition(".")[0], []).append(key)
+            self._category_index = index
+        return [self._get_scanner(key) for key in self._category_index.get(category, ())]
+
+    def scan_all(
+        self,
+        categories: list[str] | None = None,
+        on_progress: Callable[[BaseScanner, list[ScannedItem]], None] | None = None,
+    ) -> ScanResult:
         """
         执行全量扫描
 
         Args:
             categories: 要扫描的类别列表，None 表示扫描全部
+            on_progress: 每个扫描器完成时的回调 (扫描器, 未经分析的扫描项)，
+                按完成顺序在扫描线程中调用，用于界面逐步显示进度
 
         Returns:
             ScanResult: 扫描结果
         """
+        wanted = None if categories is None else frozenset(categories)
+        selected = [
+            self._get_scanner(key)
+            for key in self._scanner_factories
+            if wanted is None or key.partition(".")[0] in wanted
+        ]
+
         items: list[ScannedItem] = []
+        for scanned in self._run_scanners(selected, on_progress):
+            items.extend(scanned)
 
-        for scanner in self._scanners:
-            if categories is None or scanner.category in categories:
-                try:
-                    scanned = scanner.scan()
-                    items.extend(scanned)
-                except Exception as e:
-                    # TODO: 使用 logger 记录错误
-                    print(f"Scanner {scanner.name} failed: {e}")
-
-        analyzed_items = (
-            DiffAnalyzer.compare(items, self._defaults_db) if self._defaults_db else items
-        )
+        analyzer = self._analyzer
+        analyzed_items = analyzer.analyze_items(items) if analyzer is not None else items
 
         return ScanResult(
             os_version=self._defaults_os_version,
@@ -266,13 +672,46 @@ class StyleEngine:
             duration_ms=None,
         )
 
+    def _run_scanners(
+        self,
+        scanners: list[BaseScanner],
+        on_progress: Callable[[BaseScanner, list[ScannedItem]], None] | None = None,
+    ) -> list[list[ScannedItem]]:
+        """
+        执行扫描器，结果顺序与传入顺序一致
+
+        各扫描器的注册表/文件读取互不依赖，按 AppConfig.concurrency 并发执行；
+        concurrency <= 1 时顺序执行，便于调试。
+        """
+        scan = self._safe_scan
+        if on_progress is not None:
+
+            def scan(scanner: BaseScanner) -> list[ScannedItem]:
+                scanned = self._safe_scan(scanner)
+                on_progress(scanner, scanned)
+                return scanned
+
+        workers = min(self._ctx.config.concurrency, len(scanners))
+        if workers <= 1:
+            return [scan(scanner) for scanner in scanners]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wss-scan") as executor:
+            return list(executor.map(scan, scanners))
+
+    def _safe_scan(self, scanner: BaseScanner) -> list[ScannedItem]:
+        """执行单个扫描器，失败时记录日志并返回空列表"""
+        try:
+            return scanner.scan()
+        except (ScanError, OSError) as e:
+            # 预期内的扫描失败（权限不足、文件缺失等），无需记录堆栈
+            self._logger.warning("Scanner %s failed: %s", scanner.name, e)
+        except Exception:
+            self._logger.exception("Scanner %s failed", scanner.name)
+        return []
+
     def _generate_summary(self, items: list[ScannedItem]) -> dict[str, int]:
         """生成扫描结果摘要"""
-        summary: dict[str, int] = {}
-        for item in items:
-            category = item.category
-            summary[category] = summary.get(category, 0) + 1
-        return summary
+        return dict(Counter(item.category for item in items))
 
     def export_package(
         self,
@@ -293,18 +732,14 @@ class StyleEngine:
         Returns:
             Manifest: 导出包的清单
         """
-        output_path = Path(output_path)
+        output_path = _as_path(output_path)
         if output_path.suffix.lower() == ".zip":
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                output_dir = Path(tmp_dir)
-                manifest = self._write_package(
-                    output_dir,
-                    scan_result=scan_result,
-                    include_assets=include_assets,
-                    include_font_files=include_font_files,
-                )
-                self._zip_dir(output_dir, output_path)
-                return manifest
+            return self._write_package_zip(
+                output_path,
+                scan_result=scan_result,
+                include_assets=include_assets,
+                include_font_files=include_font_files,
+            )
 
         output_path.mkdir(parents=True, exist_ok=True)
         return self._write_package(
@@ -328,12 +763,27 @@ class StyleEngine:
             dry_run: 仅预览，不实际应用
             create_restore_point: 是否创建系统还原点
         """
-        package_path = Path(package_path)
+        package_path = _as_path(package_path)
         if package_path.suffix.lower() == ".zip":
+            if dry_run:
+                # 预览只需要 scan.json，不解压资产
+                with _PackageReader(package_path) as reader:
+                    scan_bytes = reader.read_bytes("scan.json")
+                if scan_bytes is None:
+                    return {"total": 0, "applied": 0, "failed": 0, "skipped": 0}
+                scan_result = ScanResult.model_validate(jsonio.loads(scan_bytes))
+                return self._build_dry_run_result(scan_result)
+
             with tempfile.TemporaryDirectory() as tmp_dir:
                 output_dir = Path(tmp_dir)
                 with zipfile.ZipFile(package_path, "r") as zip_ref:
-                    zip_ref.extractall(output_dir)
+                    # 只解压导入用到的 scan.json 与 assets/
+                    members = [
+                        name
+                        for name in zip_ref.namelist()
+                        if name == "scan.json" or name.startswith("assets/")
+                    ]
+                    zip_ref.extractall(output_dir, members=members)
                 return self._import_from_dir(
                     output_dir,
                     dry_run=dry_run,
@@ -359,34 +809,14 @@ class StyleEngine:
         if include_assets:
             assets_dir.mkdir(parents=True, exist_ok=True)
 
-        source_system = self._build_source_system()
-        export_options = self._build_export_options(scan_result)
-
-        manifest = Manifest.model_validate(
-            {
-                "$schema": "1.0.0",
-                "version": "1.0.0",
-                "created_by": "WinstyleS",
-                "source_system": source_system.model_dump(mode="json"),
-                "export_options": export_options.model_dump(mode="json"),
-            }
-        )
+        manifest = self._build_manifest(scan_result)
 
         manifest_path = output_dir / "manifest.json"
-        manifest_path.write_text(
-            json.dumps(
-                manifest.model_dump(mode="json", by_alias=True),
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        manifest_path.write_bytes(jsonio.dumps(manifest.model_dump(mode="json", by_alias=True)))
 
         scan_path = output_dir / "scan.json"
-        scan_path.write_text(
-            json.dumps(scan_result.model_dump(mode="json"), ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        with open(scan_path, "wb") as f:
+            f.writelines(_iter_scan_json(scan_result))
 
         if include_assets:
             self._export_assets(
@@ -397,42 +827,146 @@ class StyleEngine:
 
         return manifest
 
+    def _write_package_zip(
+        self,
+        output_path: Path,
+        scan_result: ScanResult,
+        include_assets: bool,
+        include_font_files: bool,
+    ) -> Manifest:
+        """直接写出 zip 配置包：JSON 在内存中序列化后写入，资产从源路径读取，不经过临时目录"""
+        manifest = self._build_manifest(scan_result)
+        payloads = [
+            ("manifest.json", jsonio.dumps(manifest.model_dump(mode="json", by_alias=True))),
+            # 拼接分段结果：省去整份 model_dump 字典，峰值内存约为最终文件大小
+            ("scan.json", b"".join(_iter_scan_json(scan_result))),
+        ]
+        assets = self._plan_assets(scan_result, include_font_files) if include_assets else []
+
+        with _open_package_zip(output_path) as zip_ref:
+            for arcname, data in payloads:
+                compress_type, compresslevel = _zip_compression_for(".json")
+                zip_ref.writestr(
+                    arcname,
+                    data,
+                    compress_type=compress_type,
+                    compresslevel=compresslevel,
+                )
+            for src_path, _, category, dest_name in assets:
+                _zip_write_file(zip_ref, src_path, f"assets/{category}/{dest_name}")
+        return manifest
+
+    def _build_manifest(self, scan_result: ScanResult) -> Manifest:
+        source_system = self._build_source_system()
+        export_options = self._build_export_options(scan_result)
+
+        # 直接传入已构建的模型实例（Pydantic 不会重复校验），避免先 dump 再校验一遍
+        return Manifest.model_validate(
+            {
+                "$schema": "1.0.0",
+                "version": "1.0.0",
+                "created_by": "WinstyleS",
+                "source_system": source_system,
+                "export_options": export_options,
+            }
+        )
+
     def _export_assets(
         self,
         scan_result: ScanResult,
         assets_dir: Path,
         include_font_files: bool,
     ) -> None:
-        copied_by_category: dict[str, set[str]] = {}
+        # 每个类别的目标目录只创建一次；值为 (目录, 导出前是否已存在)
+        dest_dirs: dict[str, tuple[Path, bool]] = {}
+        # 先串行完成去重、命名与建目录，再统一复制
+        pending: list[tuple[Path, Path]] = []
+        for src_path, src_stat, category, dest_name in self._plan_assets(
+            scan_result, include_font_files
+        ):
+            dest_entry = dest_dirs.get(category)
+            if dest_entry is None:
+                dest_dir = assets_dir / category
+                try:
+                    dest_dir.mkdir(parents=True)
+                    dest_entry = (dest_dir, False)
+                except FileExistsError:
+                    dest_entry = (dest_dir, True)
+                dest_dirs[category] = dest_entry
+            dest_dir, dest_dir_existed = dest_entry
+            dest_path = dest_dir / dest_name
+            if dest_dir_existed and _is_same_copy(src_stat, dest_path):
+                # 重复导出到同一目录：复制会保留修改时间，大小与时间一致即视为已是同一份文件
+                continue
+            pending.append((src_path, dest_path))
+
+        self._copy_files(pending)
+
+    def _plan_assets(
+        self,
+        scan_result: ScanResult,
+        include_font_files: bool,
+    ) -> list[tuple[Path, os.stat_result, str, str]]:
+        """
+        确定需要导出的资产及其在包内的文件名
+
+        Returns:
+            [(源路径, 源文件 stat, 类别, 目标文件名)]，已去重且跳过缺失文件
+        """
+        # 已收录的 (类别, 规范化源路径)；normcase 在 Windows 上忽略大小写与斜杠差异
+        seen: set[tuple[str, str]] = set()
+        # 已占用的目标文件名（小写），以及同名文件的下一个编号，避免逐个探测磁盘
+        used_names: dict[str, set[str]] = {}
+        next_index: dict[tuple[str, str], int] = {}
+        skip_fonts = not include_font_files
+        planned: list[tuple[Path, os.stat_result, str, str]] = []
         for item in scan_result.items:
+            files = item.associated_files
+            if not files:
+                continue
             category_key = item.category
-            if category_key not in copied_by_category:
-                copied_by_category[category_key] = set()
-            for file in item.associated_files:
-                if file.type == AssetType.FONT and not include_font_files:
+            for file in files:
+                if not file.exists or (skip_fonts and file.type is AssetType.FONT):
                     continue
-                if not file.exists:
-                    continue
-                src_path = Path(file.path)
-                if not src_path.exists():
+                seen_key = (category_key, os.path.normcase(file.path))
+                if seen_key in seen:
                     continue
-                normalized_src = str(src_path).lower()
-                if normalized_src in copied_by_category[category_key]:
+                try:
+                    src_stat = os.stat(file.path)
+                except OSError:
                     continue
-                dest_dir = assets_dir / item.category
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                dest_path = dest_dir / src_path.name
-                if dest_path.exists():
-                    dest_path = dest_dir / f"{src_path.stem}_{abs(hash(src_path))}{src_path.suffix}"
-                shutil.copy2(src_path, dest_path)
-                copied_by_category[category_key].add(normalized_src)
-
-    def _zip_dir(self, source_dir: Path, output_path: Path) -> None:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_ref:
-            for file_path in source_dir.rglob("*"):
-                if file_path.is_file():
-                    zip_ref.write(file_path, file_path.relative_to(source_dir))
+                src_path = Path(file.path)
+                used = used_names.setdefault(category_key, set())
+                dest_name = src_path.name
+                if dest_name.lower() in used:
+                    # 同名不同源：追加编号，与导入时 `{stem}_*{suffix}` 的匹配规则一致
+                    counter_key = (category_key, dest_name.lower())
+                    index = next_index.get(counter_key, 1)
+                    while f"{src_path.stem}_{index}{src_path.suffix}".lower() in used:
+                        index += 1
+                    next_index[counter_key] = index + 1
+                    dest_name = f"{src_path.stem}_{index}{src_path.suffix}"
+                used.add(dest_name.lower())
+                seen.add(seen_key)
+                planned.append((src_path, src_stat, category_key, dest_name))
+        return planned
+
+    def _copy_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """
+        复制 (源, 目标) 文件对
+
+        大文件复制主要耗时在系统调用（期间释放 GIL），按 AppConfig.concurrency 并发执行；
+        concurrency <= 1 或仅有一个文件时顺序复制。任一复制失败时异常向上传播。
+        """
+        workers = min(self._ctx.config.concurrency, len(pairs))
+        if workers <= 1:
+            for src, dst in pairs:
+                _copy_file(src, dst)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wss-copy") as executor:
+            for _ in executor.map(lambda pair: _copy_file(*pair), pairs):
+                pass
 
     def _import_from_dir(
         self,
@@ -444,24 +978,14 @@ class StyleEngine:
         if not scan_path.exists():
             return {"total": 0, "applied": 0, "failed": 0, "skipped": 0}
 
-        scan_data = json.loads(scan_path.read_text(encoding="utf-8"))
+        scan_data = jsonio.loads(scan_path.read_bytes())
         scan_result = ScanResult.model_validate(scan_data)
-        resolved_scan = self._resolve_import_assets(scan_result, package_dir)
 
         if dry_run:
-            plan = self._build_dry_run_plan(resolved_scan.items)
-            would_apply = sum(1 for item in plan if item["action"] == "apply")
-            would_skip = len(plan) - would_apply
-            return {
-                "total": len(resolved_scan.items),
-                "applied": 0,
-                "failed": 0,
-                "skipped": len(resolved_scan.items),
-                "would_apply": would_apply,
-                "would_skip": would_skip,
-                "dry_run_plan": plan,
-                "risk_summary": self._summarize_risk(plan),
-            }
+            # 预览结果不依赖资产路径，无需把资产复制到本机
+            return self._build_dry_run_result(scan_result)
+
+        resolved_scan = self._resolve_import_assets(scan_result, package_dir)
 
         if create_restore_point:
             restore_manager = RestorePointManager()
@@ -472,8 +996,7 @@ class StyleEngine:
         skipped = 0
 
         for item in resolved_scan.items:
-            readonly_flag = item.metadata.get("readonly")
-            if isinstance(readonly_flag, bool) and readonly_flag:
+            if _is_readonly(item):
                 skipped += 1
                 continue
 
@@ -496,11 +1019,25 @@ class StyleEngine:
             "skipped": skipped,
         }
 
+    def _build_dry_run_result(self, scan_result: ScanResult) -> dict[str, Any]:
+        plan = self._build_dry_run_plan(scan_result.items)
+        would_apply = sum(1 for item in plan if item["action"] == "apply")
+        would_skip = len(plan) - would_apply
+        return {
+            "total": len(scan_result.items),
+            "applied": 0,
+            "failed": 0,
+            "skipped": len(scan_result.items),
+            "would_apply": would_apply,
+            "would_skip": would_skip,
+            "dry_run_plan": plan,
+            "risk_summary": self._summarize_risk(plan),
+        }
+
     def _build_dry_run_plan(self, items: list[ScannedItem]) -> list[dict[str, Any]]:
         plan: list[dict[str, Any]] = []
         for item in items:
-            readonly_flag = item.metadata.get("readonly")
-            is_readonly = isinstance(readonly_flag, bool) and readonly_flag
+            is_readonly = _is_readonly(item)
             scanner = self._find_scanner_for_item(item)
 
             action = "apply"
@@ -528,39 +1065,30 @@ class StyleEngine:
         return plan
 
     def _summarize_risk(self, plan: list[dict[str, Any]]) -> dict[str, int]:
-        summary = {"low": 0, "medium": 0, "high": 0}
-        for entry in plan:
-            risk = str(entry.get("risk", "")).lower()
-            if risk in summary:
-                summary[risk] += 1
-        return summary
+        counts = Counter(str(entry.get("risk", "")).lower() for entry in plan)
+        return {"low": counts["low"], "medium": counts["medium"], "high": counts["high"]}
 
     def _infer_import_operation(self, item: ScannedItem, action: str) -> str:
         if action == "skip":
             return "skip"
-        if item.source_type.value == "registry":
-            return "set_registry_value"
-        if item.source_type.value == "file":
-            return "write_file"
-        if item.source_type.value == "system_api":
-            return "invoke_system_api"
-        return "apply"
+        return _IMPORT_OPERATION_BY_SOURCE.get(item.source_type, "apply")
 
     def _assess_import_risk(self, item: ScannedItem, action: str) -> tuple[str, str]:
         if action == "skip":
             return "low", "dry-run 仅预览，不会执行写入"
 
-        if item.source_type.value == "registry":
-            if item.category in {"fonts", "theme", "cursor", "wallpaper"}:
+        source_type = item.source_type
+        if source_type is SourceType.REGISTRY:
+            if item.category in _APPEARANCE_CATEGORIES:
                 return "high", "涉及系统外观相关注册表写入"
             return "medium", "涉及注册表写入"
 
-        if item.source_type.value == "file":
+        if source_type is SourceType.FILE:
             if item.associated_files:
                 return "medium", "涉及配置文件与关联资源调整"
             return "low", "仅涉及配置文件写入"
 
-        if item.source_type.value == "system_api":
+        if source_type is SourceType.SYSTEM_API:
             return "high", "涉及系统 API 调用"
 
         return "medium", "未知来源类型，建议谨慎执行"
@@ -574,103 +1102,183 @@ class StyleEngine:
         home_root.mkdir(parents=True, exist_ok=True)
 
         rewritten_items: list[ScannedItem] = []
+        target_dirs: dict[str, Path] = {}
+        # 每个类别的包内资产目录只列举一次
+        asset_indexes: dict[str, dict[str, Path]] = {}
         for item in scan_result.items:
+            files = item.associated_files
+            if not files:
+                rewritten_items.append(item)
+                continue
+
+            category = item.category
+            category_dir = assets_root / category
             rewritten_files = []
-            for file in item.associated_files:
-                source_path = Path(file.path)
-                if source_path.exists():
+            for file in files:
+                if os.path.exists(file.path):
+                    # 本机已有该文件（同机导入），无需从包内复制
                     rewritten_files.append(file)
                     continue
 
+                asset_index = asset_indexes.get(category)
+                if asset_index is None:
+                    asset_index = self._index_package_assets(category_dir)
+                    asset_indexes[category] = asset_index
                 package_file = self._find_asset_in_package(
-                    assets_root / item.category,
+                    category_dir,
                     file.name,
+                    index=asset_index,
                 )
                 if package_file is None:
                     rewritten_files.append(file)
                     continue
 
-                target_dir = home_root / item.category
-                target_dir.mkdir(parents=True, exist_ok=True)
+                target_dir = target_dirs.get(category)
+                if target_dir is None:
+                    target_dir = home_root / category
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    target_dirs[category] = target_dir
                 target_path = target_dir / package_file.name
-                if not target_path.exists():
-                    shutil.copy2(package_file, target_path)
+                try:
+                    size_bytes = target_path.stat().st_size
+                except FileNotFoundError:
+                    _copy_file(package_file, target_path)
+                    size_bytes = target_path.stat().st_size
 
                 rewritten_files.append(
                     file.model_copy(
                         update={
                             "path": str(target_path),
                             "exists": True,
-                            "size_bytes": target_path.stat().st_size,
+                            "size_bytes": size_bytes,
                         }
                     )
                 )
 
-            updated_item = item.model_copy(update={"associated_files": rewritten_files})
-            if rewritten_files:
-                if updated_item.key in {"wallpaper.path", "wallpaper.transcoded"}:
-                    updated_item = updated_item.model_copy(
-                        update={"current_value": rewritten_files[0].path}
-                    )
-                elif updated_item.key.startswith("cursor."):
-                    updated_item = updated_item.model_copy(
-                        update={"current_value": rewritten_files[0].path}
-                    )
-            rewritten_items.append(updated_item)
+            # 壁纸与指针项的当前值就是资产路径，需要同步改写
+            update: dict[str, Any] = {"associated_files": rewritten_files}
+            key = item.key
+            if key in _ASSET_PATH_VALUE_KEYS or key.startswith("cursor."):
+                update["current_value"] = rewritten_files[0].path
+            rewritten_items.append(item.model_copy(update=update))
 
         return scan_result.model_copy(update={"items": rewritten_items})
 
-    def _find_asset_in_package(self, category_dir: Path, name: str) -> Path | None:
-        if not category_dir.exists():
+    def _index_package_assets(self, category_dir: Path) -> dict[str, Path]:
+        """列举分类目录下的文件 {规范化文件名: 路径}，目录不存在时返回空字典"""
+        try:
+            with os.scandir(category_dir) as entries:
+                return {
+                    os.path.normcase(entry.name): Path(entry.path)
+                    for entry in entries
+                    if entry.is_file()
+                }
+        except OSError:
+            return {}
+
+    def _find_asset_in_package(
+        self,
+        category_dir: Path,
+        name: str,
+        index: dict[str, Path] | None = None,
+    ) -> Path | None:
+        """
+        在包内分类目录中查找资产：先按原文件名匹配，再匹配导出时重命名的 `{stem}_*{suffix}`
+
+        Args:
+            category_dir: 包内分类目录
+            name: 资产原文件名
+            index: 预先列举的目录索引（见 _index_package_assets），None 时现场列举
+        """
+        files = index if index is not None else self._index_package_assets(category_dir)
+        if not files:
             return None
 
-        exact = category_dir / name
-        if exact.exists():
+        normalized = os.path.normcase(name)
+        exact = files.get(normalized)
+        if exact is not None:
             return exact
 
-        stem = Path(name).stem
-        suffix = Path(name).suffix
-        for candidate in category_dir.glob(f"{stem}_*{suffix}"):
-            if candidate.is_file():
+        stem, suffix = os.path.splitext(normalized)
+        prefix = f"{stem}_"
+        min_length = len(prefix) + len(suffix)
+        for candidate_name, candidate in files.items():
+            if (
+                len(candidate_name) >= min_length
+                and candidate_name.startswith(prefix)
+                and candidate_name.endswith(suffix)
+            ):
                 return candidate
         return None
 
     def load_scan_result(self, package_path: Path) -> ScanResult | None:
-        data = self._read_json_from_package(Path(package_path), "scan.json")
+        package_path = _as_path(package_path)
+        source = (
+            package_path if package_path.suffix.lower() == ".zip" else package_path / "scan.json"
+        )
+        try:
+            stat = source.stat()
+        except OSError:
+            return None
+        data = _read_scan_bytes_cached(
+            os.path.abspath(package_path), stat.st_mtime_ns, stat.st_size
+        )
         if data is None:
             return None
-        return ScanResult.model_validate(data)
+        try:
+            payload = jsonio.loads(data)
+        except jsonio.JSONDecodeError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return ScanResult.model_validate(payload)
 
     def load_manifest(self, package_path: Path) -> Manifest | None:
-        data = self._read_json_from_package(Path(package_path), "manifest.json")
+        data = self._read_json_from_package(_as_path(package_path), "manifest.json")
         if data is None:
             return None
         return Manifest.model_validate(data)
 
-    def _read_json_from_package(self, package_path: Path, filename: str) -> dict[str, Any] | None:
-        if package_path.suffix.lower() == ".zip":
-            try:
-                with zipfile.ZipFile(package_path, "r") as zip_ref:
-                    if filename not in zip_ref.namelist():
-                        return None
-                    with zip_ref.open(filename) as handle:
-                        payload = json.loads(handle.read().decode("utf-8"))
-                        if isinstance(payload, dict):
-                            return payload
-                        return None
-            except (OSError, KeyError, json.JSONDecodeError):
-                return None
+    def load_package(self, package_path: Path) -> tuple[Manifest | None, ScanResult | None]:
+        """
+        同时读取配置包的 manifest.json 与 scan.json（zip 包只打开一次）
 
-        file_path = package_path / filename
-        if not file_path.exists():
-            return None
+        Args:
+            package_path: 配置包路径（目录或 .zip）
+
+        Returns:
+            (manifest, scan_result)，缺失或无法解析的部分为 None
+        """
+        manifest_data: dict[str, Any] | None = None
+        scan_data: dict[str, Any] | None = None
+        try:
+            with _PackageReader(_as_path(package_path)) as reader:
+                manifest_data = self._read_json_member(reader, "manifest.json")
+                scan_data = self._read_json_member(reader, "scan.json")
+        except OSError:
+            pass
+
+        manifest = Manifest.model_validate(manifest_data) if manifest_data is not None else None
+        scan_result = ScanResult.model_validate(scan_data) if scan_data is not None else None
+        return manifest, scan_result
+
+    def _read_json_from_package(self, package_path: Path, filename: str) -> dict[str, Any] | None:
         try:
-            payload = json.loads(file_path.read_text(encoding="utf-8"))
-            if isinstance(payload, dict):
-                return payload
+            with _PackageReader(package_path) as reader:
+                return self._read_json_member(reader, filename)
+        except OSError:
             return None
-        except (OSError, json.JSONDecodeError):
+
+    def _read_json_member(self, reader: _PackageReader, filename: str) -> dict[str, Any] | None:
+        """读取包内 JSON 对象，缺失、读取失败或不是对象时返回 None"""
+        try:
+            data = reader.read_bytes(filename)
+            if data is None:
+                return None
+            payload = jsonio.loads(data)
+        except (OSError, jsonio.JSONDecodeError):
             return None
+        return payload if isinstance(payload, dict) else None
 
     def diff_packages(self, package_a: Path, package_b: Path) -> dict[str, Any]:
         scan_a = self.load_scan_result(package_a)
@@ -685,26 +1293,19 @@ class StyleEngine:
         items_a = {(item.category, item.key): item for item in scan_a.items}
         items_b = {(item.category, item.key): item for item in scan_b.items}
 
-        all_keys = sorted(set(items_a) | set(items_b))
+        # 单次遍历：先按包 A 的顺序输出修改/未变/删除项，再按包 B 的顺序追加新增项
         diff_items: list[dict[str, Any]] = []
         counts = {"added": 0, "removed": 0, "modified": 0, "unchanged": 0}
 
-        for category, key in all_keys:
-            item_a = items_a.get((category, key))
+        for (category, key), item_a in items_a.items():
+            before = item_a.current_value
             item_b = items_b.get((category, key))
-            if item_a is None:
-                change = "added"
-                before = None
-                after = item_b.current_value if item_b else None
-            elif item_b is None:
+            if item_b is None:
                 change = "removed"
-                before = item_a.current_value
                 after = None
             else:
-                before = item_a.current_value
                 after = item_b.current_value
                 change = "unchanged" if before == after else "modified"
-
             counts[change] += 1
             diff_items.append(
                 {
@@ -716,10 +1317,24 @@ class StyleEngine:
                 }
             )
 
+        for (category, key), item_b in items_b.items():
+            if (category, key) in items_a:
+                continue
+            counts["added"] += 1
+            diff_items.append(
+                {
+                    "category": category,
+                    "key": key,
+                    "change": "added",
+                    "before": None,
+                    "after": item_b.current_value,
+                }
+            )
+
         return {
             "package_a": str(package_a),
             "package_b": str(package_b),
-            "total": len(all_keys),
+            "total": len(diff_items),
             "added": counts["added"],
             "removed": counts["removed"],
             "modified": counts["modified"],
@@ -728,9 +1343,7 @@ class StyleEngine:
         }
 
     def _find_scanner_for_item(self, item: ScannedItem) -> BaseScanner | None:
-        for scanner in self._scanners:
-            if scanner.category != item.category:
-                continue
+        for scanner in self._scanners_for_category(item.category):
             if scanner.supports_item(item):
                 return scanner
         return None
@@ -10,18 +10,31 @@ ReportGenerator - 扫描报告生成器
 from __future__ import annotations
 
 import fnmatch
-import json
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 from winstyles.core.update_checker import UpdateChecker, UpdateInfo
 from winstyles.domain.models import OpenSourceFontInfo, ScannedItem, ScanResult
 from winstyles.domain.types import ChangeType
+from winstyles.utils import jsonio
 from winstyles.utils.font_utils import find_font_path, get_font_version
 
+# 并发检查字体更新的最大线程数
+_UPDATE_CHECK_WORKERS = 8
 
-@dataclass
+# 行内 Markdown 语法（_inline_md 使用）
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MD_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_MD_CODE_RE = re.compile(r"`([^`]+)`")
+_MD_ITALIC_RE = re.compile(r"\*([^*]+)\*")
+
+
+@dataclass(slots=True)
 class ClassifiedChanges:
     """分类后的变更"""
 
@@ -69,15 +82,44 @@ class ReportGenerator:
         "SimHei",
     ]
 
+    # 以上两组子串各合并为一个正则，一次 search 代替逐个 `in` 检查
+    _USER_CUSTOM_KEY_RE = re.compile("|".join(map(re.escape, USER_CUSTOM_KEYS)))
+    _SYSTEM_DEFAULT_FONT_RE = re.compile("|".join(map(re.escape, SYSTEM_DEFAULT_FONTS)))
+
     def __init__(self, scan_result: ScanResult, check_updates: bool = True) -> None:
         self.scan_result = scan_result
         self.check_updates = check_updates
-        self.update_checker = UpdateChecker()
-        self._font_db: list[OpenSourceFontInfo] = []
-        self._version_diffs: dict[str, dict[str, str]] = {}
-        self._load_font_db()
-
-    def _load_font_db(self) -> None:
+        # 字体名称 -> 匹配结果（含未命中），扫描结果中重复的值只匹配一次
+        self._match_cache: dict[str, OpenSourceFontInfo | None] = {}
+        # 字体名称 -> 本机字体版本
+        self._local_versions: dict[str, str | None] = {}
+        # 分类结果与 Markdown 文本，同时生成两种格式时只计算一次
+        self._classified: ClassifiedChanges | None = None
+        self._markdown: str | None = None
+
+    @cached_property
+    def update_checker(self) -> UpdateChecker:
+        return UpdateChecker()
+
+    @cached_property
+    def _font_data(self) -> tuple[list[OpenSourceFontInfo], dict[str, dict[str, str]]]:
+        """(开源字体列表, 字体替换版本差异)，首次匹配字体时才加载（可能访问网络）"""
+        return self._load_font_db()
+
+    @cached_property
+    def _font_db(self) -> list[OpenSourceFontInfo]:
+        return self._font_data[0]
+
+    @property
+    def _version_diffs(self) -> dict[str, dict[str, str]]:
+        return self._font_data[1]
+
+    @cached_property
+    def _font_pattern(self) -> re.Pattern[str] | None:
+        """全部字体通配模式合并成的正则（命名分组 f{i} 对应 _font_db[i]），无模式时为 None"""
+        return self._compile_font_patterns(self._font_db)
+
+    def _load_font_db(self) -> tuple[list[OpenSourceFontInfo], dict[str, dict[str, str]]]:
         """加载开源字体数据库 (优先远程，失败回退本地)"""
         data = None
 
@@ -90,61 +132,85 @@ class ReportGenerator:
             db_path = Path(__file__).resolve().parents[3] / "data" / "opensource_fonts.json"
             if db_path.exists():
                 try:
-                    with open(db_path, encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = jsonio.loads(db_path.read_bytes())
                 except Exception:
                     pass
 
         if not data:
-            return
-
-        for font in data.get("fonts", []):
-            self._font_db.append(
-                OpenSourceFontInfo(
-                    name=font["name"],
-                    patterns=font.get("patterns", []),
-                    homepage=font.get("homepage", ""),
-                    download=font.get("download", ""),
-                    license=font.get("license", ""),
-                    description=font.get("description", ""),
-                )
+            return [], {}
+
+        font_db = [
+            OpenSourceFontInfo(
+                name=font["name"],
+                patterns=font.get("patterns", []),
+                homepage=font.get("homepage", ""),
+                download=font.get("download", ""),
+                license=font.get("license", ""),
+                description=font.get("description", ""),
             )
+            for font in data.get("fonts", [])
+        ]
 
         version_diffs = data.get("version_differences", {})
-        self._version_diffs = version_diffs.get("font_substitutes", {})
+        return font_db, version_diffs.get("font_substitutes", {})
+
+    @staticmethod
+    def _compile_font_patterns(font_db: list[OpenSourceFontInfo]) -> re.Pattern[str] | None:
+        """
+        将全部字体的通配模式合并为一个正则，匹配一次即可确定字体
+
+        分支按数据库顺序排列，正则从左到右尝试分支，结果与逐个 fnmatch 的首个命中一致。
+        匹配在所有平台上都忽略大小写（与 Windows 下的 fnmatch.fnmatch 行为一致）。
+        """
+        branches = [
+            f"(?P<f{index}>{'|'.join(fnmatch.translate(p) for p in patterns)})"
+            for index, font_info in enumerate(font_db)
+            if (patterns := font_info.patterns)
+        ]
+        return re.compile("|".join(branches), re.IGNORECASE) if branches else None
 
     def _match_font(self, font_name: str) -> OpenSourceFontInfo | None:
         """匹配开源字体"""
-        for font_info in self._font_db:
-            for pattern in font_info.patterns:
-                if fnmatch.fnmatch(font_name, pattern):
-                    return font_info
-        return None
-
-    def _is_user_customization(self, item: ScannedItem) -> bool:
-        """判断是否为用户自定义"""
-        # 检查是否为已知的用户自定义键
-        for key in self.USER_CUSTOM_KEYS:
-            if key in item.key:
-                # 检查是否为非系统默认值
-                value = str(item.current_value)
-                if not any(df in value for df in self.SYSTEM_DEFAULT_FONTS):
-                    return True
-
-        # 检查字体值是否匹配开源字体
-        value = str(item.current_value)
-        if self._match_font(value):
+        try:
+            return self._match_cache[font_name]
+        except KeyError:
+            pass
+
+        font_info = None
+        if self._font_pattern is not None:
+            match = self._font_pattern.match(font_name)
+            if match is not None and match.lastgroup is not None:
+                font_info = self._font_db[int(match.lastgroup[1:])]
+        self._match_cache[font_name] = font_info
+        return font_info
+
+    def _is_user_customization(
+        self, item: ScannedItem, value: str, font_info: OpenSourceFontInfo | None
+    ) -> bool:
+        """
+        判断是否为用户自定义
+
+        Args:
+            item: 扫描项
+            value: str(item.current_value)，由调用方预先计算
+            font_info: 该值的开源字体匹配结果，由调用方预先计算
+        """
+        # 字体值匹配开源字体
+        if font_info is not None:
             return True
 
-        return False
+        # 已知的用户自定义键，且值不是系统默认字体
+        return (
+            self._USER_CUSTOM_KEY_RE.search(item.key) is not None
+            and self._SYSTEM_DEFAULT_FONT_RE.search(value) is None
+        )
 
-    def _is_version_difference(self, item: ScannedItem) -> bool:
-        """判断是否为版本差异"""
-        if item.key in self.VERSION_DIFF_KEYS:
-            expected = self.VERSION_DIFF_KEYS[item.key]
-            actual = str(item.current_value)
+    def _is_version_difference(self, item: ScannedItem, value: str) -> bool:
+        """判断是否为版本差异（value 为 str(item.current_value)）"""
+        expected = self.VERSION_DIFF_KEYS.get(item.key)
+        if expected is not None:
             default = str(item.default_value) if item.default_value else ""
-            return actual in expected or default in expected
+            return value in expected or default in expected
 
         # FontLink 条目通常是系统默认
         if "FontLink" in item.source_path:
@@ -153,42 +219,91 @@ class ReportGenerator:
         return False
 
     def classify_changes(self) -> ClassifiedChanges:
-        """将变更分类"""
+        """将变更分类（结果会被缓存，重复调用不再重新匹配字体和检查更新）"""
+        if self._classified is not None:
+            return self._classified
         result = ClassifiedChanges()
 
+        detected: list[tuple[ScannedItem, OpenSourceFontInfo, str]] = []
+        # 循环内用到的方法先绑定为局部变量
+        match_font = self._match_font
+        is_user_customization = self._is_user_customization
+        is_version_difference = self._is_version_difference
+        add_custom = result.user_customizations.append
+        add_version_diff = result.version_differences.append
+        add_default = result.system_defaults.append
+        modified = ChangeType.MODIFIED
+
         for item in self.scan_result.items:
             # 检测开源字体
             value = str(item.current_value)
-            font_info = self._match_font(value)
+            font_info = match_font(value)
             if font_info:
-                update_info = None
-                if self.check_updates:
-                    # 1. 查找本地文件路径
-                    # 注意：value 是字体名称 (如 "Maple Mono SC NF")，需要解析为文件路径
-                    font_path = find_font_path(value)
-                    local_version = get_font_version(font_path) if font_path else None
-
-                    # 2. 检查更新
-                    update_info = self.update_checker.check_font_update(font_info, local_version)
-
-                result.detected_fonts.append((item, font_info, update_info))
+                detected.append((item, font_info, value))
 
             # 分类
-            if self._is_user_customization(item):
-                result.user_customizations.append(item)
-            elif self._is_version_difference(item):
-                result.version_differences.append(item)
-            else:
+            if is_user_customization(item, value, font_info):
+                add_custom(item)
+            elif is_version_difference(item, value):
+                add_version_diff(item)
+            elif item.change_type == modified:
                 # 如果有默认值且不同，视为修改
-                if item.change_type == ChangeType.MODIFIED:
-                    result.user_customizations.append(item)
-                else:
-                    result.system_defaults.append(item)
+                add_custom(item)
+            else:
+                add_default(item)
 
+        updates = self._check_font_updates(detected) if self.check_updates else {}
+        result.detected_fonts = [
+            (item, font_info, updates.get(value)) for item, font_info, value in detected
+        ]
+        self._classified = result
         return result
 
+    def _check_font_updates(
+        self, detected: list[tuple[ScannedItem, OpenSourceFontInfo, str]]
+    ) -> dict[str, UpdateInfo | None]:
+        """
+        检查检测到的开源字体更新
+
+        按字体名称去重后并发执行（每次检查都是一次网络请求），结果与逐项检查一致。
+
+        Args:
+            detected: [(扫描项, 字体信息, 字体名称)]
+
+        Returns:
+            {字体名称: 更新信息}
+        """
+        unique = {value: font_info for _, font_info, value in detected}
+        if not unique:
+            return {}
+
+        def check(value: str, font_info: OpenSourceFontInfo) -> UpdateInfo | None:
+            return self.update_checker.check_font_update(font_info, self._local_font_version(value))
+
+        workers = min(_UPDATE_CHECK_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wss-update") as executor:
+            return dict(zip(unique, executor.map(check, unique.keys(), unique.values())))
+
+    def _local_font_version(self, font_name: str) -> str | None:
+        """
+        查找本机已安装字体的版本，按字体名称缓存（多次分类时不再重复查找字体文件）
+
+        Args:
+            font_name: 字体名称 (如 "Maple Mono SC NF")，需要先解析为文件路径
+        """
+        try:
+            return self._local_versions[font_name]
+        except KeyError:
+            pass
+        font_path = find_font_path(font_name)
+        version = get_font_version(font_path) if font_path else None
+        self._local_versions[font_name] = version
+        return version
+
     def generate_markdown(self) -> str:
-        """生成 Markdown 格式报告"""
+        """生成 Markdown 格式报告（结果会被缓存，供 generate_html 复用）"""
+        if self._markdown is not None:
+            return self._markdown
         classified = self.classify_changes()
         lines: list[str] = []
 
@@ -202,43 +317,33 @@ class ReportGenerator:
         lines.append("| 类别 | 用户自定义 | 系统差异 | 系统标准 |")
         lines.append("|------|-----------|---------|---------|")
 
-        # 按类别统计
-        categories: dict[str, dict[str, int]] = {}
-        for item in classified.user_customizations:
-            cat = item.category
-            if cat not in categories:
-                categories[cat] = {"custom": 0, "diff": 0, "default": 0}
-            categories[cat]["custom"] += 1
-
-        for item in classified.version_differences:
-            cat = item.category
-            if cat not in categories:
-                categories[cat] = {"custom": 0, "diff": 0, "default": 0}
-            categories[cat]["diff"] += 1
-
-        for item in classified.system_defaults:
-            cat = item.category
-            if cat not in categories:
-                categories[cat] = {"custom": 0, "diff": 0, "default": 0}
-            categories[cat]["default"] += 1
-
-        for cat, counts in sorted(categories.items()):
-            lines.append(f"| {cat} | {counts['custom']} | {counts['diff']} | {counts['default']} |")
+        # 按类别统计：[用户自定义, 系统差异, 系统标准]，一次遍历三组结果
+        categories: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for column, items in enumerate(
+            (
+                classified.user_customizations,
+                classified.version_differences,
+                classified.system_defaults,
+            )
+        ):
+            for item in items:
+                categories[item.category][column] += 1
+
+        for cat, (custom, diff, default) in sorted(categories.items()):
+            lines.append(f"| {cat} | {custom} | {diff} | {default} |")
 
         # 用户自定义配置
         if classified.user_customizations:
             lines.append("\n## 🎨 用户自定义配置\n")
 
             # 按类别分组
-            by_category: dict[str, list[ScannedItem]] = {}
+            by_category: defaultdict[str, list[ScannedItem]] = defaultdict(list)
             for item in classified.user_customizations:
-                if item.category not in by_category:
-                    by_category[item.category] = []
                 by_category[item.category].append(item)
 
-            for category, items in sorted(by_category.items()):
+            for category, category_items in sorted(by_category.items()):
                 lines.append(f"\n### {category.title()}\n")
-                for item in items:
+                for item in category_items:
                     default_str = f" (默认: {item.default_value})" if item.default_value else ""
                     lines.append(f"- **{item.key}**: `{item.current_value}`{default_str}")
 
@@ -297,7 +402,8 @@ class ReportGenerator:
             lines.append("\n## 📦 系统标准配置\n")
             lines.append(f"*共 {default_count} 项系统标准配置 (已隐藏)*\n")
 
-        return "\n".join(lines)
+        self._markdown = "\n".join(lines)
+        return self._markdown
 
     def generate_html(self, embedded: bool = False) -> str:
         """生成 HTML 格式报告"""
@@ -438,6 +544,8 @@ class ReportGenerator:
         lines = md.split("\n")
         html_lines: list[str] = []
         in_table = False
+        # 表格的第一行为表头
+        header_row = False
         in_list = False
 
         for line in lines:
@@ -446,12 +554,14 @@ class ReportGenerator:
                 if not in_table:
                     html_lines.append("<table>")
                     in_table = True
+                    header_row = True
 
                 if "---" in line:
                     continue
 
                 cells = [c.strip() for c in line.split("|")[1:-1]]
-                tag = "th" if not any("<tr>" in ln for ln in html_lines[-5:]) else "td"
+                tag = "th" if header_row else "td"
+                header_row = False
                 row = "".join(f"<{tag}>{self._inline_md(c)}</{tag}>" for c in cells)
                 html_lines.append(f"<tr>{row}</tr>")
                 continue
@@ -493,15 +603,13 @@ class ReportGenerator:
 
     def _inline_md(self, text: str) -> str:
         """处理行内 Markdown"""
-        import re
-
         # 链接
-        text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2">\1</a>', text)
+        text = _MD_LINK_RE.sub(r'<a href="\2">\1</a>', text)
         # 粗体
-        text = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", text)
+        text = _MD_BOLD_RE.sub(r"<strong>\1</strong>", text)
         # 行内代码
-        text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+        text = _MD_CODE_RE.sub(r"<code>\1</code>", text)
         # 斜体
-        text = re.sub(r"\*([^*]+)\*", r"<em>\1</em>", text)
+        text = _MD_ITALIC_RE.sub(r"<em>\1</em>", text)
 
         return text
@@ -8,16 +8,24 @@ UpdateChecker - 资源更新检查器
 
 from __future__ import annotations
 
-import json
+import contextlib
+import hashlib
+import os
 import re
+import tempfile
+import urllib.error
 import urllib.request
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 from typing import Any
 
+from winstyles.core.context import AppContext
 from winstyles.domain.models import OpenSourceFontInfo
+from winstyles.utils import jsonio
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateInfo:
     """更新信息"""
 
@@ -39,8 +47,20 @@ class UpdateChecker:
     # 社区维护的字体数据库 (Source: braver/programmingfonts)
     COMMUNITY_DB_URL = "https://cdn.jsdelivr.net/gh/braver/programmingfonts@master/fonts.json"
 
-    def __init__(self) -> None:
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """
+        Args:
+            cache_dir: HTTP 响应缓存目录，None 时使用应用数据目录下的 http_cache
+        """
         self._font_db_cache: dict[str, Any] | None = None
+        self._cache_dir_override = cache_dir
+
+    @cached_property
+    def _cache_dir(self) -> Path:
+        """HTTP 响应缓存目录，默认位于应用数据目录下（首次用到时创建数据目录）"""
+        if self._cache_dir_override is not None:
+            return self._cache_dir_override
+        return AppContext().config.ensure_data_dir() / "http_cache"
 
     def fetch_remote_db(self) -> dict[str, Any] | None:
         """获取远程字体数据库 (合并官方库与社区库)"""
@@ -69,15 +89,105 @@ class UpdateChecker:
 
     def _fetch_json(self, url: str) -> dict[str, Any] | None:
         """通用 JSON 获取方法"""
+        body = self._http_get(url)
+        if body is None:
+            return None
+        try:
+            payload = jsonio.loads(body)
+        except (jsonio.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def _http_get(self, url: str, headers: dict[str, str] | None = None) -> bytes | None:
+        """
+        GET 请求，利用本地缓存的 ETag / Last-Modified 发起条件请求
+
+        服务端返回 304 时读取本地缓存的响应体，返回 200 时更新缓存；请求失败返回 None。
+
+        Args:
+            url: 请求地址
+            headers: 额外请求头
+
+        Returns:
+            响应体字节串
+        """
+        body_path, meta_path = self._cache_paths(url)
+        request = urllib.request.Request(url, headers=headers or {})
+        meta = self._read_cache_meta(meta_path)
+        if meta and body_path.exists():
+            if meta.get("etag"):
+                request.add_header("If-None-Match", meta["etag"])
+            if meta.get("last_modified"):
+                request.add_header("If-Modified-Since", meta["last_modified"])
+
         try:
-            with urllib.request.urlopen(url, timeout=5) as response:
-                if response.status == 200:
-                    payload = json.loads(response.read().decode("utf-8"))
-                    if isinstance(payload, dict):
-                        return payload
+            with urllib.request.urlopen(request, timeout=5) as response:
+                if response.status != 200:
+                    return None
+                body: bytes = response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                return None
+            try:
+                return body_path.read_bytes()
+            except OSError:
+                return None
         except Exception:
+            return None
+
+        if etag or last_modified:
+            self._write_cache(body_path, meta_path, body, etag, last_modified)
+        return body
+
+    def _cache_paths(self, url: str) -> tuple[Path, Path]:
+        """URL 对应的 (响应体缓存文件, 元数据文件)"""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return self._cache_dir / f"{digest}.body", self._cache_dir / f"{digest}.meta.json"
+
+    def _read_cache_meta(self, meta_path: Path) -> dict[str, str] | None:
+        try:
+            meta = jsonio.loads(meta_path.read_bytes())
+        except (OSError, jsonio.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    def _write_cache(
+        self,
+        body_path: Path,
+        meta_path: Path,
+        body: bytes,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """
+        写入响应缓存，失败时忽略（缓存只用于加速）
+
+        并发检查更新时其他线程可能同时读取同一缓存：两个文件都先写临时文件再原子替换，
+        且先替换响应体、后替换元数据，读取方不会读到写了一半的文件，
+        也不会拿到比响应体更新的 ETag。
+        """
+        try:
+            self._cache_dir.mkdir(exist_ok=True)
+            self._replace_file(body_path, body)
+            self._replace_file(
+                meta_path, jsonio.dumps({"etag": etag, "last_modified": last_modified})
+            )
+        except OSError:
             pass
-        return None
+
+    def _replace_file(self, path: Path, data: bytes) -> None:
+        """在缓存目录中写入临时文件后原子替换目标文件"""
+        fd, temp_name = tempfile.mkstemp(dir=self._cache_dir, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_name, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
 
     def _adapt_community_db(self, data: dict[str, Any]) -> list[dict[str, Any]]:
         """将 programmingfonts 格式转换为 FontInfo 字典格式"""
@@ -167,20 +277,17 @@ class UpdateChecker:
     def _fetch_github_latest(self, repo_slug: str) -> tuple[str, str]:
         """调用 GitHub API 获取最新 Release"""
         api_url = f"https://api.github.com/repos/{repo_slug}/releases/latest"
-        req = urllib.request.Request(api_url)
-        # 添加 User-Agent 避免被 GitHub 拒绝
-        req.add_header("User-Agent", "WinstyleS-Updater")
-
-        with urllib.request.urlopen(req, timeout=5) as response:
-            if response.status == 200:
-                payload = json.loads(response.read().decode("utf-8"))
-                if not isinstance(payload, dict):
-                    raise ValueError("Invalid GitHub API response")
-                tag_name = str(payload.get("tag_name", ""))
-                html_url = str(payload.get("html_url", ""))
-                return tag_name, html_url
-
-        raise ValueError("Failed to fetch GitHub release")
+        # 添加 User-Agent 避免被 GitHub 拒绝；条件请求命中 304 时不计入 API 限额
+        body = self._http_get(api_url, headers={"User-Agent": "WinstyleS-Updater"})
+        if body is None:
+            raise ValueError("Failed to fetch GitHub release")
+
+        payload = jsonio.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid GitHub API response")
+        tag_name = str(payload.get("tag_name", ""))
+        html_url = str(payload.get("html_url", ""))
+        return tag_name, html_url
 
     def _clean_version(self, version: str) -> str:
         """清洗版本号，移除 'Version ', 'v' 等前缀"""
@@ -61,8 +61,9 @@ class ScanResult(BaseModel):
 
     @property
     def modified_count(self) -> int:
-        """修改过的配置项数量"""
-        return len(self.modified_items)
+        """修改过的配置项数量（直接计数，不构建中间列表）"""
+        default = ChangeType.DEFAULT
+        return sum(1 for item in self.items if item.change_type != default)
 
 
 class SourceSystem(BaseModel):
@@ -10,11 +10,17 @@ WinstyleSApp - 主应用窗口
 
 from __future__ import annotations
 
+import os
+import re
 import subprocess
 import sys
 import tempfile
 import threading
+import time
 import webbrowser
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TypedDict
 
@@ -22,8 +28,9 @@ import customtkinter as ctk  # type: ignore[import-untyped]
 
 from winstyles.core.engine import StyleEngine
 from winstyles.core.report import ReportGenerator
-from winstyles.core.update_checker import UpdateChecker
-from winstyles.domain.models import ScanResult
+from winstyles.core.update_checker import UpdateChecker, UpdateInfo
+from winstyles.domain.models import OpenSourceFontInfo, ScannedItem, ScanResult
+from winstyles.plugins.base import BaseScanner
 from winstyles.utils.font_utils import find_font_path, get_font_version
 
 
@@ -35,6 +42,16 @@ class FontUpdateEntry(TypedDict):
     has_update: bool
 
 
+@dataclass(slots=True)
+class _UpdateCard:
+    """字体更新卡片及其需要按内容更新的子控件"""
+
+    frame: ctk.CTkFrame
+    name_label: ctk.CTkLabel
+    version_label: ctk.CTkLabel
+    download_btn: ctk.CTkButton
+
+
 class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
     """
     WinstyleS 主应用窗口
@@ -56,6 +73,38 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
     COLOR_WARNING = "#FF8C00"
     COLOR_DANGER = "#D13438"
 
+    # 状态栏颜色名 -> 颜色
+    STATUS_COLORS = {
+        "green": COLOR_SUCCESS,
+        "yellow": COLOR_WARNING,
+        "red": COLOR_DANGER,
+    }
+
+    # 页面名称 -> 顶部标题 / 描述
+    PAGE_TITLES = {
+        "scan": "扫描",
+        "report": "分析报告",
+        "updates": "字体更新",
+        "export": "导出",
+        "import": "导入",
+        "settings": "设置",
+    }
+    PAGE_DESCRIPTIONS = {
+        "scan": "扫描系统个性化配置并生成差异数据",
+        "report": "智能分析配置变更，识别开源字体",
+        "updates": "检查已安装开源字体的最新版本",
+        "export": "导出配置包，便于迁移与备份",
+        "import": "从配置包恢复个性化设置",
+        "settings": "管理默认路径与显示选项",
+    }
+
+    # 扫描结果在此时间内被报告/更新页面复用（秒），点击「开始扫描」总是重新扫描
+    SCAN_CACHE_TTL_SECONDS = 60.0
+    # 检查字体更新的最大并发请求数
+    UPDATE_CHECK_WORKERS = 8
+    # 浏览器报告写入系统临时目录下的固定文件，每次覆盖
+    HTML_REPORT_FILENAME = "winstyles_report.html"
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -77,15 +126,34 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         self.font_body = ctk.CTkFont(family="Segoe UI Variable", size=13)
         self.font_small = ctk.CTkFont(family="Segoe UI Variable", size=11)
         self.font_mono = ctk.CTkFont(family="Cascadia Code", size=12)
+        self.font_icon = ctk.CTkFont(size=24)
 
         # 状态
         self.active_page = "scan"
         self.nav_buttons: dict[str, ctk.CTkButton] = {}
+        # 页面在首次切换到时才构建：名称 -> 构建函数 / 已构建的页面
+        self._page_builders: dict[str, Callable[[], ctk.CTkFrame]] = {}
         self.pages: dict[str, ctk.CTkFrame] = {}
 
         # 数据
         self._scan_result: ScanResult | None = None
+        self._scan_cache_time = 0.0
+        self._scan_lock = threading.Lock()
+        # 保护报告生成器缓存与 HTML 报告文件；生成器内部缓存不是线程安全的，生成报告时全程持有
+        self._report_lock = threading.Lock()
+        # (scan_id, 是否检查更新) -> 报告生成器（生成器内部缓存分类结果与 Markdown）
+        self._report_generators: dict[tuple[str, bool], ReportGenerator] = {}
+        # 当前 HTML 报告文件对应的 (scan_id, 是否检查更新)
+        self._html_report_key: tuple[str, bool] | None = None
+        # 字体名称 -> 本机字体版本，重新扫描时清空
+        self._font_version_cache: dict[str, str | None] = {}
         self._font_updates: list[FontUpdateEntry] = []
+        # 正在后台执行的操作（仅在主线程读写）
+        self._inflight: set[str] = set()
+        # 扫描进度输出缓冲：扫描线程写入，主线程每 50ms 合并插入一次
+        self._pending_output: list[str] = []
+        self._output_lock = threading.Lock()
+        self._output_flush_scheduled = False
 
         # 创建界面
         self._create_widgets()
@@ -177,14 +245,14 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         # 主内容区
         self.main_frame = ctk.CTkFrame(self, corner_radius=0, fg_color=self.COLOR_BG)
 
-        # 页面容器
-        self.pages = {
-            "scan": self._build_scan_page(),
-            "report": self._build_report_page(),
-            "updates": self._build_updates_page(),
-            "export": self._build_export_page(),
-            "import": self._build_import_page(),
-            "settings": self._build_settings_page(),
+        # 页面容器（按需构建）
+        self._page_builders = {
+            "scan": self._build_scan_page,
+            "report": self._build_report_page,
+            "updates": self._build_updates_page,
+            "export": self._build_export_page,
+            "import": self._build_import_page,
+            "settings": self._build_settings_page,
         }
 
         # 状态栏
@@ -234,50 +302,41 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         self.status_label.pack(side="left", padx=20)
 
     def _set_active_page(self, name: str) -> None:
+        # 点击当前页面时无需重新布局
+        if name == self.active_page and name in self.pages:
+            return
+
+        # 同一时间只有当前页面处于 grid 中，只需移除它
+        previous = self.active_page
+        previous_page = self.pages.get(previous)
+        if previous_page is not None:
+            previous_page.grid_forget()
         self.active_page = name
-        for page in self.pages.values():
-            page.grid_forget()
 
-        self.pages[name].grid(row=0, column=0, sticky="nsew")
-        self._update_nav_style(name)
+        page = self.pages.get(name)
+        if page is None:
+            page = self.pages[name] = self._page_builders[name]()
+        page.grid(row=0, column=0, sticky="nsew")
+        self._update_nav_style(previous, name)
         self._update_header(name)
 
-    def _update_nav_style(self, active: str) -> None:
-        for name, btn in self.nav_buttons.items():
-            if name.startswith("_sep_"):
-                continue
-            if name == active:
-                btn.configure(
-                    fg_color=self.COLOR_ACCENT,
-                    text_color="white",
-                    hover_color=self.COLOR_ACCENT_HOVER,
-                )
-            else:
-                btn.configure(
-                    fg_color=self.COLOR_PANEL,
-                    text_color=self.COLOR_TEXT,
-                    hover_color=self.COLOR_DIVIDER,
-                )
+    def _update_nav_style(self, previous: str, active: str) -> None:
+        """只重新配置前后两个导航按钮的样式"""
+        if previous != active and previous in self.nav_buttons:
+            self.nav_buttons[previous].configure(
+                fg_color=self.COLOR_PANEL,
+                text_color=self.COLOR_TEXT,
+                hover_color=self.COLOR_DIVIDER,
+            )
+        self.nav_buttons[active].configure(
+            fg_color=self.COLOR_ACCENT,
+            text_color="white",
+            hover_color=self.COLOR_ACCENT_HOVER,
+        )
 
     def _update_header(self, name: str) -> None:
-        title_map = {
-            "scan": "扫描",
-            "report": "分析报告",
-            "updates": "字体更新",
-            "export": "导出",
-            "import": "导入",
-            "settings": "设置",
-        }
-        desc_map = {
-            "scan": "扫描系统个性化配置并生成差异数据",
-            "report": "智能分析配置变更，识别开源字体",
-            "updates": "检查已安装开源字体的最新版本",
-            "export": "导出配置包，便于迁移与备份",
-            "import": "从配置包恢复个性化设置",
-            "settings": "管理默认路径与显示选项",
-        }
-        self.header_title.configure(text=title_map.get(name, ""))
-        self.header_desc.configure(text=desc_map.get(name, ""))
+        self.header_title.configure(text=self.PAGE_TITLES.get(name, ""))
+        self.header_desc.configure(text=self.PAGE_DESCRIPTIONS.get(name, ""))
 
     # ======== Scan Page ========
 
@@ -342,18 +401,105 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         return frame
 
     def _on_scan_click(self) -> None:
+        if not self._begin_action("scan"):
+            return
         self.scan_btn.configure(state="disabled")
         self.set_status("正在扫描...", "yellow")
         self._append_scan_output("开始扫描...\n", clear=True)
 
-        thread = threading.Thread(target=self._run_scan, daemon=True)
-        thread.start()
+        self._start_worker(self._run_scan)
+
+    def _begin_action(self, name: str) -> bool:
+        """
+        标记操作开始执行，同一操作尚未完成时忽略重复点击
+
+        Args:
+            name: 操作名称，工作线程结束时从 self._inflight 中移除
+
+        Returns:
+            操作可以开始时返回 True
+        """
+        if name in self._inflight:
+            return False
+        self._inflight.add(name)
+        return True
+
+    def _start_worker(self, target: Callable[[], None]) -> None:
+        """在后台守护线程中执行耗时任务（关闭窗口时不等待任务结束）"""
+        threading.Thread(target=target, daemon=True).start()
+
+    def _post_ui(self, actions: list[Callable[[], object]]) -> None:
+        """
+        将一组界面更新合并为一次 Tk 事件，在主线程中按顺序执行
+
+        Args:
+            actions: 界面更新回调列表
+        """
+
+        def run() -> None:
+            for action in actions:
+                action()
+
+        self.after(0, run)
+
+    def _get_or_scan(
+        self,
+        force: bool = False,
+        on_progress: Callable[[BaseScanner, list[ScannedItem]], None] | None = None,
+    ) -> ScanResult:
+        """
+        获取扫描结果，缓存未过期时直接复用（在工作线程中调用）
+
+        Args:
+            force: 忽略缓存，重新扫描
+            on_progress: 实际扫描时每个扫描器完成后的回调，见 StyleEngine.scan_all
+
+        Returns:
+            全类别扫描结果
+        """
+        with self._scan_lock:
+            result = None if force else self._get_cached_scan()
+            if result is None:
+                result = StyleEngine().scan_all(categories=None, on_progress=on_progress)
+                self._scan_result = result
+                self._scan_cache_time = time.monotonic()
+                with self._report_lock:
+                    self._report_generators.clear()
+                self._font_version_cache.clear()
+            return result
+
+    def _get_cached_scan(self) -> ScanResult | None:
+        """返回未过期的全类别扫描结果，没有或已过期时返回 None"""
+        result = self._scan_result
+        if (
+            result is None
+            or time.monotonic() - self._scan_cache_time >= self.SCAN_CACHE_TTL_SECONDS
+        ):
+            return None
+        return result
+
+    def _get_report_generator(self, result: ScanResult, check_updates: bool) -> ReportGenerator:
+        """
+        获取报告生成器，按 (scan_id, 是否检查更新) 复用
+
+        同一次扫描先后生成 Markdown 与 HTML 报告时只分类、检查更新一次。
+        调用方需持有 _report_lock，并在使用完生成器前不释放。
+
+        Args:
+            result: 扫描结果
+            check_updates: 是否检查字体更新
+        """
+        key = (result.scan_id, check_updates)
+        generator = self._report_generators.get(key)
+        if generator is None:
+            generator = ReportGenerator(result, check_updates=check_updates)
+            self._report_generators[key] = generator
+        return generator
 
     def _run_scan(self) -> None:
+        actions: list[Callable[[], object]] = []
         try:
-            engine = StyleEngine()
-            result = engine.scan_all(categories=None)
-            self._scan_result = result
+            result = self._get_or_scan(force=True, on_progress=self._on_scan_progress)
 
             summary = result.summary
             lines = [
@@ -366,17 +512,45 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
                 lines.append(f"  {category}: {count}")
 
             output = "\n".join(lines) + "\n"
-            self.after(0, lambda: self._append_scan_output(output, clear=True))
-            self.after(
-                0, lambda: self.scan_summary.configure(text=f"最近一次扫描：{result.scan_time}")
-            )
-            self.after(0, lambda: self.set_status("扫描完成", "green"))
+            actions += [
+                self._drop_pending_scan_output,
+                lambda: self._append_scan_output(output, clear=True),
+                lambda: self.scan_summary.configure(text=f"最近一次扫描：{result.scan_time}"),
+                lambda: self.set_status("扫描完成", "green"),
+            ]
         except Exception as exc:
             message = f"扫描失败: {exc}\n"
-            self.after(0, lambda: self._append_scan_output(message, clear=True))
-            self.after(0, lambda: self.set_status("扫描失败", "red"))
+            actions += [
+                self._drop_pending_scan_output,
+                lambda: self._append_scan_output(message, clear=True),
+                lambda: self.set_status("扫描失败", "red"),
+            ]
         finally:
-            self.after(0, lambda: self.scan_btn.configure(state="normal"))
+            actions.append(lambda: self.scan_btn.configure(state="normal"))
+            actions.append(lambda: self._inflight.discard("scan"))
+            self._post_ui(actions)
+
+    def _on_scan_progress(self, scanner: BaseScanner, items: list[ScannedItem]) -> None:
+        """扫描器完成回调（在扫描线程中调用），输出先进入缓冲区，由主线程批量插入"""
+        with self._output_lock:
+            self._pending_output.append(f"  [{scanner.category}] {scanner.name}: {len(items)}\n")
+            if self._output_flush_scheduled:
+                return
+            self._output_flush_scheduled = True
+        self.after(50, self._flush_scan_output)
+
+    def _flush_scan_output(self) -> None:
+        with self._output_lock:
+            text = "".join(self._pending_output)
+            self._pending_output.clear()
+            self._output_flush_scheduled = False
+        if text:
+            self._append_scan_output(text)
+
+    def _drop_pending_scan_output(self) -> None:
+        """扫描结束时丢弃尚未插入的进度输出（随后显示完整摘要）"""
+        with self._output_lock:
+            self._pending_output.clear()
 
     def _append_scan_output(self, text: str, clear: bool = False) -> None:
         self.scan_output.configure(state="normal")
@@ -472,6 +646,8 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         return frame
 
     def _on_report_click(self) -> None:
+        if not self._begin_action("report"):
+            return
         self.report_btn.configure(state="disabled")
         self.set_status("正在分析系统配置...", "yellow")
         self.report_output.configure(state="normal")
@@ -479,59 +655,69 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         self.report_output.insert("end", "正在扫描中，请稍候...\n")
         self.report_output.configure(state="disabled")
 
-        thread = threading.Thread(target=self._run_report_generation, daemon=True)
-        thread.start()
+        self._start_worker(self._run_report_generation)
 
     def _run_report_generation(self) -> None:
+        actions: list[Callable[[], object]] = []
         try:
-            engine = StyleEngine()
-            result = engine.scan_all(categories=None)
-            self._scan_result = result
-
+            result = self._get_or_scan()
             check_updates = self.check_updates_var.get()
-            generator = ReportGenerator(result, check_updates=check_updates)
-            report_content = generator.generate_markdown()
+            with self._report_lock:
+                generator = self._get_report_generator(result, check_updates)
+                report_content = generator.generate_markdown()
 
-            self.after(0, lambda: self._show_report(report_content))
-            self.after(0, lambda: self.set_status("报告生成完成", "green"))
+            actions += [
+                lambda: self._show_report(report_content),
+                lambda: self.set_status("报告生成完成", "green"),
+            ]
         except Exception as exc:
             message = f"生成失败: {exc}\n"
-            self.after(0, lambda: self._show_report(message))
-            self.after(0, lambda: self.set_status("生成失败", "red"))
+            actions += [
+                lambda: self._show_report(message),
+                lambda: self.set_status("生成失败", "red"),
+            ]
         finally:
-            self.after(0, lambda: self.report_btn.configure(state="normal"))
+            actions.append(lambda: self.report_btn.configure(state="normal"))
+            actions.append(lambda: self._inflight.discard("report"))
+            self._post_ui(actions)
 
     def _on_open_report_browser(self) -> None:
+        if not self._begin_action("browser_report"):
+            return
         self.open_browser_btn.configure(state="disabled")
         self.set_status("正在生成 HTML 报告...", "yellow")
 
-        thread = threading.Thread(target=self._run_open_browser_report, daemon=True)
-        thread.start()
+        self._start_worker(self._run_open_browser_report)
 
     def _run_open_browser_report(self) -> None:
+        actions: list[Callable[[], object]] = []
         try:
-            engine = StyleEngine()
-            result = engine.scan_all(categories=None)
-
+            result = self._get_or_scan()
             check_updates = self.check_updates_var.get()
-            generator = ReportGenerator(result, check_updates=check_updates)
-            html_content = generator.generate_html()
-
-            # 保存到临时文件
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".html", delete=False, encoding="utf-8"
-            ) as f:
-                f.write(html_content)
-                temp_path = f.name
+            report_path = Path(tempfile.gettempdir()) / self.HTML_REPORT_FILENAME
+
+            # 同一扫描结果的报告已写出时直接打开，否则生成后原子替换固定路径的文件
+            report_key = (result.scan_id, check_updates)
+            with self._report_lock:
+                if report_key != self._html_report_key or not report_path.exists():
+                    generator = self._get_report_generator(result, check_updates)
+                    html_content = generator.generate_html()
+                    temp_path = report_path.with_suffix(".tmp")
+                    temp_path.write_text(html_content, encoding="utf-8")
+                    os.replace(temp_path, report_path)
+                    self._html_report_key = report_key
 
             # 在浏览器中打开
-            webbrowser.open(f"file://{temp_path}")
+            webbrowser.open(report_path.as_uri())
 
-            self.after(0, lambda: self.set_status("已在浏览器中打开报告", "green"))
+            actions.append(lambda: self.set_status("已在浏览器中打开报告", "green"))
         except Exception as exc:
-            self.after(0, lambda e=exc: self.set_status(f"打开失败: {e}", "red"))
+            message = f"打开失败: {exc}"
+            actions.append(lambda: self.set_status(message, "red"))
         finally:
-            self.after(0, lambda: self.open_browser_btn.configure(state="normal"))
+            actions.append(lambda: self.open_browser_btn.configure(state="normal"))
+            actions.append(lambda: self._inflight.discard("browser_report"))
+            self._post_ui(actions)
 
     def _show_report(self, content: str) -> None:
         self.report_output.configure(state="normal")
@@ -596,156 +782,218 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         )
         self.updates_placeholder.grid(row=0, column=0, pady=60)
 
+        # 分组标题与更新卡片在多次检查间复用，只重新配置内容
+        self._updates_section_labels: list[ctk.CTkLabel] = []
+        self._update_card_pool: list[_UpdateCard] = []
+
         return frame
 
     def _on_check_updates_click(self) -> None:
+        if not self._begin_action("check_updates"):
+            return
         self.check_updates_btn.configure(state="disabled")
         self.set_status("正在检查字体更新...", "yellow")
 
-        # 清空列表
-        for widget in self.updates_container.winfo_children():
-            widget.destroy()
-
-        loading_label = ctk.CTkLabel(
-            self.updates_container,
-            text="⏳ 正在扫描字体并检查更新...\n这可能需要几秒钟",
-            font=self.font_body,
-            text_color=self.COLOR_MUTED,
-            justify="center",
+        self._show_updates_message(
+            "⏳ 正在扫描字体并检查更新...\n这可能需要几秒钟", self.COLOR_MUTED
         )
-        loading_label.grid(row=0, column=0, pady=60)
 
-        thread = threading.Thread(target=self._run_check_updates, daemon=True)
-        thread.start()
+        self._start_worker(self._run_check_updates)
 
     def _run_check_updates(self) -> None:
+        actions: list[Callable[[], object]] = []
         try:
-            engine = StyleEngine()
-            result = engine.scan_all(categories=["fonts"])
+            # 有未过期的全量扫描结果时直接复用，否则只扫描字体类别
+            result = self._get_cached_scan() or StyleEngine().scan_all(categories=["fonts"])
 
             checker = UpdateChecker()
             db = checker.fetch_remote_db()
 
             if not db:
-                self.after(0, lambda: self._show_updates_result([]))
-                self.after(0, lambda: self.set_status("无法获取字体数据库", "red"))
+                actions += [
+                    lambda: self._show_updates_result([]),
+                    lambda: self.set_status("无法获取字体数据库", "red"),
+                ]
                 return
 
             updates: list[FontUpdateEntry] = []
             fonts_info = db.get("fonts", [])
+            # 模式统一转小写并去掉通配符，只在循环外计算一次
+            normalized_fonts = [
+                (
+                    font_info,
+                    font_info.get("name", ""),
+                    [p.lower().replace("*", "") for p in font_info.get("patterns", [])],
+                )
+                for font_info in fonts_info
+            ]
 
-            # 匹配已安装字体
+            matcher = self._compile_font_matcher([patterns for _, _, patterns in normalized_fonts])
+
+            # 匹配已安装字体：[(数据库下标, 本机版本)]
+            matched: list[tuple[int, str | None]] = []
             for item in result.items:
-                if item.category != "fonts":
+                if item.category != "fonts" or matcher is None:
                     continue
 
                 font_name = str(item.current_value)
 
-                # 在数据库中查找匹配
-                for font_info in fonts_info:
-                    patterns = font_info.get("patterns", [])
-                    name = font_info.get("name", "")
-
-                    matched = False
-                    for pattern in patterns:
-                        pattern_lower = pattern.lower().replace("*", "")
-                        if pattern_lower in font_name.lower():
-                            matched = True
-                            break
-
-                    if matched:
-                        # 获取本地版本
-                        font_path = find_font_path(font_name)
-                        local_version = None
-                        if font_path:
-                            local_version = get_font_version(font_path)
-
-                        # 构造开源字体信息对象用于检查更新
-                        from winstyles.domain.models import OpenSourceFontInfo
-
-                        fi = OpenSourceFontInfo(
-                            name=name,
-                            patterns=patterns,
-                            homepage=font_info.get("homepage", ""),
-                            download=font_info.get("download", ""),
+                # 在数据库中查找匹配（命中的分支名 f{i} 即字体在数据库中的下标）
+                match = matcher.match(font_name.lower())
+                if match is None or match.lastgroup is None:
+                    continue
+                matched.append((int(match.lastgroup[1:]), self._local_font_version(font_name)))
+
+            def check(key: tuple[int, str | None]) -> UpdateInfo | None:
+                index, local_version = key
+                font_info, name, _ = normalized_fonts[index]
+                # 构造开源字体信息对象用于检查更新
+                fi = OpenSourceFontInfo(
+                    name=name,
+                    patterns=font_info.get("patterns", []),
+                    homepage=font_info.get("homepage", ""),
+                    download=font_info.get("download", ""),
+                )
+                return checker.check_font_update(fi, local_version)
+
+            # 每次检查都是网络请求：相同 (字体, 本机版本) 只检查一次，并发执行
+            unique = list(dict.fromkeys(matched))
+            update_infos: dict[tuple[int, str | None], UpdateInfo | None] = {}
+            if unique:
+                workers = min(self.UPDATE_CHECK_WORKERS, len(unique))
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="wss-update"
+                ) as executor:
+                    update_infos = dict(zip(unique, executor.map(check, unique)))
+
+            for key in matched:
+                update_info = update_infos[key]
+                if update_info:
+                    updates.append(
+                        FontUpdateEntry(
+                            name=normalized_fonts[key[0]][1],
+                            current_version=update_info.current_version,
+                            latest_version=update_info.latest_version,
+                            download_url=update_info.download_url,
+                            has_update=update_info.has_update,
                         )
-
-                        update_info = checker.check_font_update(fi, local_version)
-                        if update_info:
-                            updates.append(
-                                FontUpdateEntry(
-                                    name=name,
-                                    current_version=update_info.current_version,
-                                    latest_version=update_info.latest_version,
-                                    download_url=update_info.download_url,
-                                    has_update=update_info.has_update,
-                                )
-                            )
-                        break
+                    )
 
             self._font_updates = updates
-            self.after(0, lambda: self._show_updates_result(updates))
-            self.after(0, lambda: self.set_status("更新检查完成", "green"))
+            actions += [
+                lambda: self._show_updates_result(updates),
+                lambda: self.set_status("更新检查完成", "green"),
+            ]
 
         except Exception as exc:
-            self.after(0, lambda e=exc: self._show_updates_error(str(e)))
-            self.after(0, lambda: self.set_status("检查失败", "red"))
+            error = str(exc)
+            actions += [
+                lambda: self._show_updates_error(error),
+                lambda: self.set_status("检查失败", "red"),
+            ]
         finally:
-            self.after(0, lambda: self.check_updates_btn.configure(state="normal"))
+            actions.append(lambda: self.check_updates_btn.configure(state="normal"))
+            actions.append(lambda: self._inflight.discard("check_updates"))
+            self._post_ui(actions)
 
-    def _show_updates_result(self, updates: list[FontUpdateEntry]) -> None:
-        # 清空容器
-        for widget in self.updates_container.winfo_children():
-            widget.destroy()
+    def _local_font_version(self, font_name: str) -> str | None:
+        """
+        获取本机已安装字体的版本，按字体名称缓存（重复点击「检查更新」时不再查找字体文件）
 
+        Args:
+            font_name: 字体名称 (如 "Maple Mono SC NF")
+        """
+        try:
+            return self._font_version_cache[font_name]
+        except KeyError:
+            pass
+        font_path = find_font_path(font_name)
+        version = get_font_version(font_path) if font_path else None
+        self._font_version_cache[font_name] = version
+        return version
+
+    @staticmethod
+    def _compile_font_matcher(patterns_by_font: list[list[str]]) -> re.Pattern[str] | None:
+        """
+        将全部字体的子串模式合并为一个正则，一次匹配找出首个命中的字体
+
+        每个字体对应一个命名分支 f{下标}，分支按数据库顺序排列；正则依次尝试各分支，
+        结果与按数据库顺序逐个做子串检查的首个命中一致。
+
+        Args:
+            patterns_by_font: 每个字体已转小写、去掉通配符的模式列表
+
+        Returns:
+            编译后的正则（应匹配小写字体名）；没有任何模式时返回 None
+        """
+        branches = [
+            f"(?P<f{index}>.*?(?:{'|'.join(map(re.escape, patterns))}))"
+            for index, patterns in enumerate(patterns_by_font)
+            if patterns
+        ]
+        return re.compile("|".join(branches), re.DOTALL) if branches else None
+
+    def _show_updates_result(self, updates: list[FontUpdateEntry]) -> None:
         if not updates:
-            label = ctk.CTkLabel(
-                self.updates_container,
-                text="未检测到已安装的开源字体\n或所有字体都是最新版本",
-                font=self.font_body,
-                text_color=self.COLOR_MUTED,
-                justify="center",
+            self._show_updates_message(
+                "未检测到已安装的开源字体\n或所有字体都是最新版本", self.COLOR_MUTED
             )
-            label.grid(row=0, column=0, pady=60)
             return
 
+        self._hide_updates_rows()
+
         # 按是否有更新分组
         has_updates = [u for u in updates if u["has_update"]]
         no_updates = [u for u in updates if not u["has_update"]]
+        groups = [
+            (has_updates, True, f"可更新 ({len(has_updates)})", self.COLOR_WARNING, (8, 8)),
+            (no_updates, False, f"已是最新 ({len(no_updates)})", self.COLOR_SUCCESS, (16, 8)),
+        ]
 
         row = 0
+        cards = iter(self._get_update_cards(len(updates)))
+        for index, (group, has_update, title, color, pady) in enumerate(groups):
+            if not group:
+                continue
 
-        if has_updates:
-            section_label = ctk.CTkLabel(
-                self.updates_container,
-                text=f"可更新 ({len(has_updates)})",
-                font=self.font_body,
-                text_color=self.COLOR_WARNING,
-            )
-            section_label.grid(row=row, column=0, sticky="w", pady=(8, 8))
+            section_label = self._updates_section_labels[index]
+            section_label.configure(text=title, text_color=color)
+            section_label.grid(row=row, column=0, sticky="w", pady=pady)
             row += 1
 
-            for update in has_updates:
-                card = self._create_update_card(update, has_update=True)
-                card.grid(row=row, column=0, sticky="ew", pady=4)
+            for update in group:
+                card = next(cards)
+                self._configure_update_card(card, update, has_update)
+                card.frame.grid(row=row, column=0, sticky="ew", pady=4)
                 row += 1
 
-        if no_updates:
-            section_label = ctk.CTkLabel(
-                self.updates_container,
-                text=f"已是最新 ({len(no_updates)})",
-                font=self.font_body,
-                text_color=self.COLOR_SUCCESS,
-            )
-            section_label.grid(row=row, column=0, sticky="w", pady=(16, 8))
-            row += 1
+    def _show_updates_message(self, text: str, color: str) -> None:
+        """隐藏更新列表，在容器中显示一条提示"""
+        self._hide_updates_rows()
+        self.updates_placeholder.configure(text=text, text_color=color)
+        self.updates_placeholder.grid(row=0, column=0, pady=60)
 
-            for update in no_updates:
-                card = self._create_update_card(update, has_update=False)
-                card.grid(row=row, column=0, sticky="ew", pady=4)
-                row += 1
+    def _hide_updates_rows(self) -> None:
+        for widget in self.updates_container.winfo_children():
+            widget.grid_forget()
+
+    def _get_update_cards(self, count: int) -> list[_UpdateCard]:
+        """
+        从卡片池中取出 count 张卡片，不足时才创建新卡片
+
+        Args:
+            count: 需要的卡片数量
+        """
+        if not self._updates_section_labels:
+            self._updates_section_labels = [
+                ctk.CTkLabel(self.updates_container, font=self.font_body) for _ in range(2)
+            ]
+        pool = self._update_card_pool
+        while len(pool) < count:
+            pool.append(self._create_update_card())
+        return pool[:count]
 
-    def _create_update_card(self, update: FontUpdateEntry, has_update: bool) -> ctk.CTkFrame:
+    def _create_update_card(self) -> _UpdateCard:
         card = ctk.CTkFrame(
             self.updates_container,
             corner_radius=8,
@@ -759,7 +1007,7 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         icon_label = ctk.CTkLabel(
             card,
             text="🔤",
-            font=ctk.CTkFont(size=24),
+            font=self.font_icon,
             width=48,
         )
         icon_label.grid(row=0, column=0, rowspan=2, padx=16, pady=16)
@@ -767,12 +1015,34 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         # 名称
         name_label = ctk.CTkLabel(
             card,
-            text=update["name"],
             font=self.font_button,
             text_color=self.COLOR_TEXT,
         )
         name_label.grid(row=0, column=1, sticky="w", pady=(16, 0))
 
+        # 版本
+        version_label = ctk.CTkLabel(card, font=self.font_small)
+        version_label.grid(row=1, column=1, sticky="w", pady=(0, 16))
+
+        # 下载按钮（仅在有更新时显示）
+        download_btn = ctk.CTkButton(
+            card,
+            text="⬇ 下载",
+            font=self.font_body,
+            height=32,
+            width=80,
+            corner_radius=6,
+            fg_color=self.COLOR_ACCENT,
+            hover_color=self.COLOR_ACCENT_HOVER,
+        )
+
+        return _UpdateCard(card, name_label, version_label, download_btn)
+
+    def _configure_update_card(
+        self, card: _UpdateCard, update: FontUpdateEntry, has_update: bool
+    ) -> None:
+        card.name_label.configure(text=update["name"])
+
         # 版本
         if has_update:
             version_text = f"{update['current_version']} → {update['latest_version']}"
@@ -780,44 +1050,19 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
         else:
             version_text = update.get("current_version") or update.get("latest_version") or "已安装"
             version_color = self.COLOR_MUTED
-
-        version_label = ctk.CTkLabel(
-            card,
-            text=version_text,
-            font=self.font_small,
-            text_color=version_color,
-        )
-        version_label.grid(row=1, column=1, sticky="w", pady=(0, 16))
+        card.version_label.configure(text=version_text, text_color=version_color)
 
         # 下载按钮
         if has_update and update.get("download_url"):
-            download_btn = ctk.CTkButton(
-                card,
-                text="⬇ 下载",
-                font=self.font_body,
-                height=32,
-                width=80,
-                corner_radius=6,
-                fg_color=self.COLOR_ACCENT,
-                hover_color=self.COLOR_ACCENT_HOVER,
-                command=lambda url=update["download_url"]: webbrowser.open(url),
+            card.download_btn.configure(
+                command=lambda url=update["download_url"]: webbrowser.open(url)
             )
-            download_btn.grid(row=0, column=2, rowspan=2, padx=16, pady=16)
-
-        return card
+            card.download_btn.grid(row=0, column=2, rowspan=2, padx=16, pady=16)
+        else:
+            card.download_btn.grid_forget()
 
     def _show_updates_error(self, error: str) -> None:
-        for widget in self.updates_container.winfo_children():
-            widget.destroy()
-
-        label = ctk.CTkLabel(
-            self.updates_container,
-            text=f"检查失败: {error}",
-            font=self.font_body,
-            text_color=self.COLOR_DANGER,
-            justify="center",
-        )
-        label.grid(row=0, column=0, pady=60)
+        self._show_updates_message(f"检查失败: {error}", self.COLOR_DANGER)
 
     # ======== Export Page ========
 
@@ -927,12 +1172,7 @@ class WinstyleSApp(ctk.CTk):  # type: ignore[misc]
     # ======== Status Bar ========
 
     def set_status(self, message: str, color: str = "green") -> None:
-        color_map = {
-            "green": self.COLOR_SUCCESS,
-            "yellow": self.COLOR_WARNING,
-            "red": self.COLOR_DANGER,
-        }
-        dot_color = color_map.get(color, self.COLOR_SUCCESS)
+        dot_color = self.STATUS_COLORS.get(color, self.COLOR_SUCCESS)
         self.status_label.configure(text=f"● {message}", text_color=dot_color)
 
 
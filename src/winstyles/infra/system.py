@@ -5,6 +5,7 @@ Windows 系统 API 封装
 """
 
 import ctypes
+import sys
 from ctypes import wintypes
 
 # Windows API 常量
@@ -101,6 +102,25 @@ class SystemAPI:
         except Exception:
             return False
 
+    @staticmethod
+    def copy_file(src: str, dst: str) -> bool:
+        """
+        使用 CopyFileW 复制文件（由系统完成复制，并保留时间戳与属性）
+
+        Args:
+            src: 源文件路径
+            dst: 目标文件路径（已存在时覆盖）
+
+        Returns:
+            是否成功（非 Windows 平台始终返回 False）
+        """
+        if sys.platform != "win32":
+            return False
+        try:
+            return int(ctypes.windll.kernel32.CopyFileW(src, dst, False)) != 0
+        except Exception:
+            return False
+
     @staticmethod
     def is_admin() -> bool:
         """
@@ -312,8 +312,7 @@ def inspect(
         raise typer.Exit(code=1)
 
     engine = StyleEngine()
-    manifest = engine.load_manifest(package_path)
-    scan = engine.load_scan_result(package_path)
+    manifest, scan = engine.load_package(package_path)
     if manifest is None:
         console.print("[red]manifest.json not found[/red]")
         raise typer.Exit(code=1)
@@ -8,10 +8,14 @@ ThemeScanner - 系统主题扫描器
 - 颜色模式
 """
 
+import struct
+
 from winstyles.domain.models import ScannedItem
 from winstyles.domain.types import ChangeType, SourceType
 from winstyles.plugins.base import BaseScanner
 
+_pack_uint32_le = struct.Struct("<I").pack
+
 
 class ThemeScanner(BaseScanner):
     """
@@ -41,10 +45,8 @@ class ThemeScanner(BaseScanner):
         return "扫描系统主题设置（深色/浅色模式、强调色、透明效果）"
 
     def _abgr_to_hex(self, value: int) -> str:
-        r = value & 0xFF
-        g = (value >> 8) & 0xFF
-        b = (value >> 16) & 0xFF
-        return f"#{r:02X}{g:02X}{b:02X}"
+        # 小端打包后前三个字节即 R、G、B
+        return "#" + _pack_uint32_le(value & 0xFFFFFF)[:3].hex().upper()
 
     def scan(self) -> list[ScannedItem]:
         """扫描主题设置"""
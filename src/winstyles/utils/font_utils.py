@@ -247,6 +247,9 @@ def get_font_version(file_path: Path) -> str | None:
     """
     读取字体文件中的版本信息的
 
+    解析结果按（路径, 修改时间, 大小）缓存，重复扫描或检查更新时不再重新解析字体文件，
+    文件被替换后自动失效。
+
     Args:
         file_path: 字体文件路径
 
@@ -257,7 +260,20 @@ def get_font_version(file_path: Path) -> str | None:
         return None
 
     try:
-        font = _TTFONT_LOADER(file_path)
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return _read_font_version(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=512)
+def _read_font_version(file_path: str, mtime_ns: int, size: int) -> str | None:
+    """解析字体 name 表中的版本字符串（mtime_ns / size 仅作为缓存键）"""
+    if _TTFONT_LOADER is None:
+        return None
+
+    try:
+        font = _TTFONT_LOADER(Path(file_path))
         # ID 5 是 Version 字符串
         # 遍历 name records 寻找英文版本信息
         version = None
@@ -0,0 +1,51 @@
+"""
+JSON 编解码工具
+
+优先使用 orjson（可选依赖，C 实现，直接处理 UTF-8 字节），
+未安装时回退到标准库 json，两者的解析结果一致。
+"""
+
+import importlib
+import json
+from typing import Any
+
+_orjson: Any = None
+
+try:
+    _orjson = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+# orjson.JSONDecodeError 继承自 json.JSONDecodeError，捕获后者即可覆盖两种实现
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    解析 JSON 文本
+
+    Args:
+        data: UTF-8 字节串或字符串
+
+    Returns:
+        解析后的 Python 对象
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    序列化为带 2 空格缩进的 UTF-8 JSON（不转义非 ASCII 字符）
+
+    Args:
+        obj: 可 JSON 序列化的对象
+
+    Returns:
+        UTF-8 编码的 JSON 字节串
+    """
+    if _orjson is not None:
+        data: bytes = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+        return data
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
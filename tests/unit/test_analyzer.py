@@ -0,0 +1,48 @@
+from winstyles.core.analyzer import DiffAnalyzer
+from winstyles.domain.models import ScannedItem
+from winstyles.domain.types import ChangeType, SourceType
+
+
+def _item(category: str, key: str, value: object) -> ScannedItem:
+    return ScannedItem(
+        category=category,
+        key=key,
+        current_value=value,
+        source_type=SourceType.REGISTRY,
+        source_path="HKCU\\test",
+    )
+
+
+def test_compare_marks_default_modified_and_added() -> None:
+    defaults_db = {
+        "theme": {"theme.appsUseLightTheme": 1, "theme.colorPrevalence": 0},
+    }
+    items = [
+        _item("theme", "theme.appsUseLightTheme", 1),
+        _item("theme", "theme.colorPrevalence", 1),
+        _item("theme", "theme.unknown", "x"),
+        _item("fonts", "Segoe UI", "Maple Mono"),
+    ]
+
+    analyzed = DiffAnalyzer.compare(items, defaults_db)
+
+    assert [item.change_type for item in analyzed] == [
+        ChangeType.DEFAULT,
+        ChangeType.MODIFIED,
+        ChangeType.ADDED,
+        ChangeType.ADDED,
+    ]
+    assert analyzed[1].default_value == 0
+    assert analyzed[3].default_value is None
+    assert items[1].change_type == ChangeType.MODIFIED
+    assert items[1].default_value is None
+
+
+def test_analyzer_instance_can_be_reused_across_batches() -> None:
+    analyzer = DiffAnalyzer({"theme": {"theme.appsUseLightTheme": 1}})
+
+    first = analyzer.analyze_items([_item("theme", "theme.appsUseLightTheme", 1)])
+    second = analyzer.analyze_items([_item("theme", "theme.appsUseLightTheme", 0)])
+
+    assert first[0].change_type == ChangeType.DEFAULT
+    assert second[0].change_type == ChangeType.MODIFIED
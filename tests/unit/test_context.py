@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from winstyles.core.context import AppConfig, AppContext
+
+
+def test_reset_does_not_duplicate_logger_handlers(tmp_path: Path) -> None:
+    AppContext.reset()
+    try:
+        AppContext(AppConfig(data_dir=tmp_path))
+        AppContext.reset()
+        logger = AppContext(AppConfig(data_dir=tmp_path)).logger
+
+        assert len(logger.handlers) == 1
+        assert logger.propagate is False
+    finally:
+        AppContext.reset()
+
+
+def test_concurrent_construction_yields_single_instance(tmp_path: Path) -> None:
+    AppContext.reset()
+    try:
+        config = AppConfig(data_dir=tmp_path)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contexts = list(executor.map(lambda _: AppContext(config), range(32)))
+
+        assert len({id(ctx) for ctx in contexts}) == 1
+        assert contexts[0].config is config
+    finally:
+        AppContext.reset()
+
+
+def test_app_config_creates_data_dir_on_demand(tmp_path: Path) -> None:
+    data_dir = tmp_path / "nested" / ".wss"
+    config = AppConfig(data_dir=data_dir)
+
+    assert not data_dir.exists()
+    assert config.ensure_data_dir() == data_dir
+    assert data_dir.is_dir()
@@ -29,3 +29,29 @@ def test_flatten_defaults_maps_theme_cursor_and_wallpaper(monkeypatch) -> None:
     assert flattened["wallpaper"]["wallpaper.style"] == "10"
     assert flattened["cursor"]["cursor.scheme"] == "Windows Default"
     assert flattened["cursor"]["cursor.arrow"] == r"C:\Windows\cursors\aero_arrow.cur"
+
+
+def test_flatten_defaults_maps_terminal_keys_to_both_setting_paths() -> None:
+    engine = StyleEngine.__new__(StyleEngine)
+    raw = {
+        "terminal": {
+            "windows_terminal": {
+                "theme": "dark",
+                "use_acrylic": False,
+                "font_face": "Cascadia Mono",
+                "font_size": 12,
+            }
+        }
+    }
+
+    terminal = engine._flatten_defaults(raw)["terminal"]
+
+    assert terminal == {
+        "windowsTerminal.theme": "dark",
+        "windowsTerminal.useAcrylicInTabRow": False,
+        "windowsTerminal.defaults.useAcrylic": False,
+        "windowsTerminal.defaults.font.face": "Cascadia Mono",
+        "windowsTerminal.defaults.fontFace": "Cascadia Mono",
+        "windowsTerminal.defaults.font.size": 12,
+        "windowsTerminal.defaults.fontSize": 12,
+    }
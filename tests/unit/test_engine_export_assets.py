@@ -1,8 +1,13 @@
+import os
+import zipfile
 from pathlib import Path
 
-from winstyles.core.engine import StyleEngine
+import pytest
+
+from winstyles.core.engine import StyleEngine, _iter_scan_json
 from winstyles.domain.models import AssociatedFile, ScannedItem, ScanResult
 from winstyles.domain.types import AssetType, ChangeType, SourceType
+from winstyles.utils import jsonio
 
 
 def _build_scan_result(font_path: Path, image_path: Path) -> ScanResult:
@@ -76,3 +81,174 @@ def test_export_assets_includes_font_files_when_enabled(tmp_path) -> None:
 
     assert (assets_dir / "fonts" / font_path.name).exists()
     assert (assets_dir / "wallpaper" / image_path.name).exists()
+
+
+def _asset_item(category: str, asset_type: AssetType, path: Path) -> ScannedItem:
+    return ScannedItem(
+        category=category,
+        key=f"{category}.{path.name}",
+        current_value=str(path),
+        source_type=SourceType.FILE,
+        source_path=str(path),
+        associated_files=[
+            AssociatedFile(type=asset_type, name=path.name, path=str(path), exists=True)
+        ],
+    )
+
+
+def test_export_package_zip_stores_precompressed_assets(tmp_path) -> None:
+    jpg = tmp_path / "bg.JPG"
+    jfif = tmp_path / "bg.jfif"
+    cursor = tmp_path / "arrow.cur"
+    jpg.write_bytes(b"image" * 100)
+    jfif.write_bytes(b"image" * 100)
+    cursor.write_bytes(b"cursor" * 100)
+    scan_result = ScanResult(
+        items=[
+            _asset_item("wallpaper", AssetType.IMAGE, jpg),
+            _asset_item("wallpaper", AssetType.IMAGE, jfif),
+            _asset_item("cursor", AssetType.CURSOR, cursor),
+        ]
+    )
+    output_path = tmp_path / "x.zip"
+
+    StyleEngine().export_package(scan_result, output_path)
+
+    with zipfile.ZipFile(output_path) as zip_ref:
+        infos = {info.filename: info for info in zip_ref.infolist()}
+        assert infos["scan.json"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["assets/wallpaper/bg.JPG"].compress_type == zipfile.ZIP_STORED
+        assert infos["assets/wallpaper/bg.jfif"].compress_type == zipfile.ZIP_STORED
+        assert infos["assets/cursor/arrow.cur"].compress_type == zipfile.ZIP_DEFLATED
+        assert zip_ref.read("assets/wallpaper/bg.JPG") == b"image" * 100
+
+
+def test_export_assets_numbers_same_named_files_from_different_sources(tmp_path) -> None:
+    items = []
+    for index, folder in enumerate(["a", "b", "c"]):
+        src = tmp_path / folder / "arrow.cur"
+        src.parent.mkdir()
+        src.write_bytes(folder.encode())
+        items.append(
+            ScannedItem(
+                category="cursor",
+                key=f"cursor.{index}",
+                current_value=str(src),
+                source_type=SourceType.REGISTRY,
+                source_path="HKCU\\test",
+                associated_files=[
+                    AssociatedFile(type=AssetType.CURSOR, name=src.name, path=str(src), exists=True)
+                ],
+            )
+        )
+    assets_dir = tmp_path / "assets"
+
+    engine = StyleEngine.__new__(StyleEngine)
+    engine._export_assets(ScanResult(items=items), assets_dir, include_font_files=False)
+
+    cursor_dir = assets_dir / "cursor"
+    assert (cursor_dir / "arrow.cur").read_bytes() == b"a"
+    assert (cursor_dir / "arrow_1.cur").read_bytes() == b"b"
+    assert (cursor_dir / "arrow_2.cur").read_bytes() == b"c"
+
+
+def test_export_package_zip_accepts_pre_1980_timestamps(tmp_path) -> None:
+    old_file = tmp_path / "legacy.ttf"
+    old_file.write_bytes(b"font")
+    os.utime(old_file, (0, 0))
+    scan_result = ScanResult(items=[_asset_item("fonts", AssetType.FONT, old_file)])
+    output_path = tmp_path / "x.zip"
+
+    StyleEngine().export_package(scan_result, output_path, include_font_files=True)
+
+    with zipfile.ZipFile(output_path) as zip_ref:
+        assert zip_ref.getinfo("assets/fonts/legacy.ttf").date_time[0] == 1980
+
+
+def test_export_assets_copies_shared_source_once_and_skips_missing(tmp_path) -> None:
+    src = tmp_path / "arrow.cur"
+    src.write_bytes(b"cursor")
+    missing = tmp_path / "gone.cur"
+    items = [
+        ScannedItem(
+            category="cursor",
+            key=f"cursor.{index}",
+            current_value=str(src),
+            source_type=SourceType.REGISTRY,
+            source_path="HKCU\\test",
+            associated_files=[
+                AssociatedFile(type=AssetType.CURSOR, name=src.name, path=str(src), exists=True),
+                AssociatedFile(
+                    type=AssetType.CURSOR, name=missing.name, path=str(missing), exists=True
+                ),
+            ],
+        )
+        for index in range(2)
+    ]
+    assets_dir = tmp_path / "assets"
+
+    engine = StyleEngine.__new__(StyleEngine)
+    engine._export_assets(ScanResult(items=items), assets_dir, include_font_files=False)
+
+    assert sorted(p.name for p in (assets_dir / "cursor").iterdir()) == ["arrow.cur"]
+
+
+def test_export_assets_skips_unchanged_files_on_repeat_export(tmp_path) -> None:
+    font_path = tmp_path / "TestFont.ttf"
+    image_path = tmp_path / "wallpaper.jpg"
+    font_path.write_bytes(b"font")
+    image_path.write_bytes(b"image")
+    scan_result = _build_scan_result(font_path, image_path)
+    assets_dir = tmp_path / "assets"
+    engine = StyleEngine.__new__(StyleEngine)
+    engine._export_assets(scan_result, assets_dir, include_font_files=True)
+
+    # 目标与源大小、时间一致时不重新复制；源被修改后重新复制
+    exported_font = assets_dir / "fonts" / font_path.name
+    exported_font.write_bytes(b"keep")
+    src_stat = font_path.stat()
+    os.utime(exported_font, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    image_path.write_bytes(b"image-v2")
+
+    engine._export_assets(scan_result, assets_dir, include_font_files=True)
+
+    assert exported_font.read_bytes() == b"keep"
+    assert (assets_dir / "wallpaper" / image_path.name).read_bytes() == b"image-v2"
+
+
+def test_export_package_zip_writes_json_and_assets_directly(tmp_path) -> None:
+    font_path = tmp_path / "TestFont.ttf"
+    image_path = tmp_path / "wallpaper.jpg"
+    font_path.write_bytes(b"font")
+    image_path.write_bytes(b"image")
+    output_path = tmp_path / "out" / "package.zip"
+
+    engine = StyleEngine()
+    engine.export_package(_build_scan_result(font_path, image_path), output_path)
+
+    with zipfile.ZipFile(output_path) as zip_ref:
+        assert sorted(zip_ref.namelist()) == [
+            "assets/wallpaper/wallpaper.jpg",
+            "manifest.json",
+            "scan.json",
+        ]
+        assert zip_ref.read("assets/wallpaper/wallpaper.jpg") == b"image"
+    manifest, scan_result = engine.load_package(output_path)
+    assert manifest is not None
+    assert scan_result is not None and len(scan_result.items) == 2
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_iter_scan_json_matches_whole_document_dump(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson and jsonio._orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "_orjson", None)
+    scan_result = _build_scan_result(tmp_path / "字体.ttf", tmp_path / "wallpaper.jpg")
+    scan_result.summary = {"fonts": 1, "wallpaper": 1}
+
+    for scan in (scan_result, ScanResult()):
+        expected = jsonio.dumps(scan.model_dump(mode="json"))
+        assert b"".join(_iter_scan_json(scan)) == expected
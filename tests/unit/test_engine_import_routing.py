@@ -1,5 +1,10 @@
 import json
+import os
+import zipfile
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from winstyles.core.engine import StyleEngine
 from winstyles.domain.models import ScannedItem, ScanResult
@@ -175,3 +180,165 @@ def test_import_dry_run_returns_itemized_plan_and_risk(tmp_path: Path) -> None:
 
     risk_summary = summary["risk_summary"]
     assert risk_summary == {"low": 2, "medium": 0, "high": 1}
+
+
+def test_zip_dry_run_reads_scan_without_extracting_assets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    item = ScannedItem(
+        category="fonts",
+        key="cleartype.enabled",
+        current_value=True,
+        default_value=None,
+        change_type=ChangeType.MODIFIED,
+        source_type=SourceType.REGISTRY,
+        source_path="HKCU\\Control Panel\\Desktop\\FontSmoothing",
+    )
+    scan = ScanResult(items=[item], summary={})
+    package_path = tmp_path / "pkg.zip"
+    with zipfile.ZipFile(package_path, "w") as zip_ref:
+        zip_ref.writestr("scan.json", json.dumps(scan.model_dump(mode="json")))
+        zip_ref.writestr("assets/fonts/Test.ttf", b"font")
+
+    def _fail_extract(*args: object, **kwargs: object) -> None:
+        raise AssertionError("dry-run must not extract the package")
+
+    monkeypatch.setattr(zipfile.ZipFile, "extractall", _fail_extract)
+
+    engine = StyleEngine()
+    engine._scanners = [_DummyScanner("fonts", "cleartype.")]
+
+    summary = engine.import_package(package_path, dry_run=True, create_restore_point=False)
+
+    assert summary["total"] == 1
+    assert summary["would_apply"] == 1
+
+
+def test_diff_packages_reports_changes_in_package_order(tmp_path: Path) -> None:
+    def _item(key: str, value: str) -> ScannedItem:
+        return ScannedItem(
+            category="theme",
+            key=key,
+            current_value=value,
+            source_type=SourceType.REGISTRY,
+            source_path="HKCU\\test",
+        )
+
+    package_a = tmp_path / "a"
+    package_b = tmp_path / "b"
+    package_a.mkdir()
+    package_b.mkdir()
+    _write_scan_package(
+        package_a, [_item("z.same", "1"), _item("b.changed", "1"), _item("a.gone", "1")]
+    )
+    _write_scan_package(
+        package_b, [_item("new", "1"), _item("b.changed", "2"), _item("z.same", "1")]
+    )
+
+    result = StyleEngine().diff_packages(package_a, package_b)
+
+    assert [(entry["key"], entry["change"]) for entry in result["items"]] == [
+        ("z.same", "unchanged"),
+        ("b.changed", "modified"),
+        ("a.gone", "removed"),
+        ("new", "added"),
+    ]
+    assert (result["total"], result["added"], result["removed"]) == (4, 1, 1)
+    assert (result["modified"], result["unchanged"]) == (1, 1)
+
+
+def test_load_package_reads_manifest_and_scan_with_single_zip_open(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    _write_scan_package(source_dir, [])
+    (source_dir / "manifest.json").write_text(
+        json.dumps(
+            {
+                "source_system": {
+                    "version": "11",
+                    "build": "22631",
+                    "hostname": "host",
+                    "username": "user",
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    package_path = tmp_path / "pkg.zip"
+    with zipfile.ZipFile(package_path, "w") as zip_ref:
+        for name in ("manifest.json", "scan.json"):
+            zip_ref.write(source_dir / name, name)
+
+    opened: list[object] = []
+    original_init = zipfile.ZipFile.__init__
+
+    def _counting_init(self: zipfile.ZipFile, *args: Any, **kwargs: Any) -> None:
+        opened.append(args[0] if args else None)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "__init__", _counting_init)
+
+    manifest, scan = StyleEngine().load_package(package_path)
+
+    assert manifest is not None and manifest.source_system.build == "22631"
+    assert scan is not None and scan.items == []
+    assert len(opened) == 1
+
+
+def test_load_scan_result_is_cached_until_file_changes(tmp_path: Path) -> None:
+    package_dir = tmp_path / "pkg"
+    package_dir.mkdir()
+    item = ScannedItem(
+        category="theme",
+        key="theme.accent",
+        current_value="#0078D4",
+        source_type=SourceType.REGISTRY,
+        source_path="HKCU\\Software",
+    )
+    _write_scan_package(package_dir, [item])
+    engine = StyleEngine()
+
+    first = engine.load_scan_result(package_dir)
+    second = StyleEngine().load_scan_result(package_dir)
+
+    assert first is not None and second is not None
+    assert first is not second
+    assert first.items is not second.items
+    assert first.items == second.items
+
+    _write_scan_package(package_dir, [item, item.model_copy(update={"key": "theme.mode"})])
+    scan_json = package_dir / "scan.json"
+    stat = scan_json.stat()
+    os.utime(scan_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = engine.load_scan_result(package_dir)
+
+    assert third is not None
+    assert [i.key for i in third.items] == ["theme.accent", "theme.mode"]
+
+
+def test_load_scan_result_mutations_do_not_leak_into_later_loads(tmp_path: Path) -> None:
+    package_dir = tmp_path / "pkg"
+    package_dir.mkdir()
+    item = ScannedItem(
+        category="theme",
+        key="theme.accent",
+        current_value="#0078D4",
+        source_type=SourceType.REGISTRY,
+        source_path="HKCU\\Software",
+    )
+    _write_scan_package(package_dir, [item])
+    engine = StyleEngine()
+
+    first = engine.load_scan_result(package_dir)
+    assert first is not None
+    first.items[0].current_value = "#FF0000"
+    first.items[0].metadata["touched"] = True
+
+    second = engine.load_scan_result(package_dir)
+
+    assert second is not None
+    assert second.items[0].current_value == "#0078D4"
+    assert second.items[0].metadata == {}
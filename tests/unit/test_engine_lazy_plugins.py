@@ -0,0 +1,238 @@
+import logging
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from winstyles.core.context import AppConfig, AppContext
+from winstyles.core.engine import StyleEngine
+from winstyles.domain.models import ScannedItem
+from winstyles.domain.types import SourceType
+from winstyles.infra.filesystem import MockFileSystemAdapter
+from winstyles.infra.registry import MockRegistryAdapter
+from winstyles.plugins.base import BaseScanner
+
+
+class _StaticScanner(BaseScanner):
+    def __init__(self, category: str) -> None:
+        super().__init__(MockRegistryAdapter({}), MockFileSystemAdapter({}))
+        self._category = category
+
+    @property
+    def id(self) -> str:
+        return f"static_{self._category}"
+
+    @property
+    def name(self) -> str:
+        return f"Static {self._category}"
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    def scan(self) -> list[ScannedItem]:
+        return [
+            ScannedItem(
+                category=self._category,
+                key=f"{self._category}.value",
+                current_value="x",
+                source_type=SourceType.FILE,
+                source_path="dummy",
+            )
+        ]
+
+    def apply(self, item: ScannedItem) -> bool:
+        return True
+
+
+def test_engine_construction_does_not_instantiate_scanners() -> None:
+    engine = StyleEngine()
+
+    assert engine._scanner_factories
+    assert engine._scanner_cache == {}
+    assert "_registry" not in engine.__dict__
+    assert "_fs" not in engine.__dict__
+
+
+def test_defaults_db_is_loaded_on_first_access() -> None:
+    engine = StyleEngine()
+    assert "_defaults" not in engine.__dict__
+
+    defaults_db = engine.defaults_db
+
+    assert "_defaults" in engine.__dict__
+    assert engine.defaults_db is defaults_db
+
+
+def test_defaults_prefers_frozen_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    frozen = types.ModuleType("winstyles.core._defaults_frozen")
+    frozen.RAW_DEFAULTS = {  # type: ignore[attr-defined]
+        "os_version": "Frozen OS",
+        "wallpaper": {"style": "10"},
+    }
+    monkeypatch.setitem(sys.modules, "winstyles.core._defaults_frozen", frozen)
+
+    engine = StyleEngine()
+
+    assert engine._defaults_os_version == "Frozen OS"
+    assert engine.defaults_db == {"wallpaper": {"wallpaper.style": "10"}}
+
+
+def test_scan_all_only_builds_requested_categories() -> None:
+    built: list[str] = []
+
+    def factory_for(category: str):
+        def factory() -> BaseScanner:
+            built.append(category)
+            return _StaticScanner(category)
+
+        return factory
+
+    engine = StyleEngine()
+    engine._scanners = []
+    engine.register_scanner(factory_for("fonts"), key="fonts.static")
+    engine.register_scanner(factory_for("theme"), key="theme.static")
+
+    result = engine.scan_all(categories=["theme"])
+    engine.scan_all(categories=["theme"])
+
+    assert [item.category for item in result.items] == ["theme"]
+    assert built == ["theme"]
+
+
+def test_register_scanner_factory_requires_key() -> None:
+    engine = StyleEngine()
+
+    with pytest.raises(ValueError):
+        engine.register_scanner(lambda: _StaticScanner("fonts"))
+
+
+@pytest.mark.parametrize("key", ["fonts", ".static", "fonts."])
+def test_register_scanner_rejects_malformed_key(key: str) -> None:
+    engine = StyleEngine()
+
+    with pytest.raises(ValueError):
+        engine.register_scanner(lambda: _StaticScanner("fonts"), key=key)
+
+
+def test_register_scanner_instance_key_must_match_category() -> None:
+    engine = StyleEngine()
+    engine._scanners = []
+
+    with pytest.raises(ValueError):
+        engine.register_scanner(_StaticScanner("fonts"), key="theme.static")
+
+    engine.register_scanner(_StaticScanner("fonts"))
+    assert [scanner.category for scanner in engine._scanners_for_category("fonts")] == ["fonts"]
+
+
+class _FailingScanner(_StaticScanner):
+    def scan(self) -> list[ScannedItem]:
+        raise RuntimeError("boom")
+
+
+def test_scan_all_keeps_registration_order_and_isolates_failures() -> None:
+    engine = StyleEngine()
+    engine._scanners = []
+    engine.register_scanner(_StaticScanner("wallpaper"))
+    engine.register_scanner(_FailingScanner("cursor"))
+    engine.register_scanner(_StaticScanner("fonts"))
+
+    result = engine.scan_all()
+
+    assert [item.category for item in result.items] == ["wallpaper", "fonts"]
+
+
+def test_scan_failures_are_logged_to_context_logger(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    AppContext.reset()
+    try:
+        ctx = AppContext(AppConfig(data_dir=tmp_path, concurrency=1))
+        ctx.logger.propagate = True
+        engine = StyleEngine(ctx)
+        engine._scanners = []
+        engine.register_scanner(_FailingScanner("cursor"))
+
+        with caplog.at_level(logging.ERROR, logger="wss"):
+            result = engine.scan_all()
+
+        assert result.items == []
+        assert "Static cursor failed" in caplog.text
+    finally:
+        AppContext.reset()
+
+
+def test_find_scanner_for_item_only_builds_matching_category() -> None:
+    built: list[str] = []
+
+    def factory_for(category: str):
+        def factory() -> BaseScanner:
+            built.append(category)
+            return _StaticScanner(category)
+
+        return factory
+
+    engine = StyleEngine()
+    engine._scanners = []
+    engine.register_scanner(factory_for("fonts"), key="fonts.static")
+    engine.register_scanner(factory_for("theme"), key="theme.static")
+    item = _StaticScanner("theme").scan()[0]
+
+    scanner = engine._find_scanner_for_item(item)
+
+    assert scanner is not None and scanner.category == "theme"
+    assert built == ["theme"]
+
+
+def test_package_readers_do_not_build_scanners_or_defaults(tmp_path: Path) -> None:
+    package_dir = tmp_path / "pkg"
+    package_dir.mkdir()
+    (package_dir / "scan.json").write_text('{"items": [], "summary": {}}', encoding="utf-8")
+
+    engine = StyleEngine()
+    engine.load_scan_result(package_dir)
+    engine.diff_packages(package_dir, package_dir)
+    engine.import_package(package_dir, dry_run=True, create_restore_point=False)
+
+    assert engine._scanner_cache == {}
+    assert "_defaults" not in engine.__dict__
+    assert "_registry" not in engine.__dict__
+
+
+def test_scan_all_runs_scanners_concurrently(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _RendezvousScanner(_StaticScanner):
+        def scan(self) -> list[ScannedItem]:
+            # 两个扫描器必须同时处于运行中才能通过屏障
+            barrier.wait()
+            return super().scan()
+
+    AppContext.reset()
+    try:
+        engine = StyleEngine(AppContext(AppConfig(data_dir=tmp_path, concurrency=2)))
+        engine._scanners = [_RendezvousScanner("fonts"), _RendezvousScanner("theme")]
+
+        result = engine.scan_all()
+
+        assert [item.category for item in result.items] == ["fonts", "theme"]
+    finally:
+        AppContext.reset()
+
+
+def test_scan_all_reports_progress_per_scanner() -> None:
+    engine = StyleEngine()
+    engine._scanners = []
+    engine.register_scanner(_StaticScanner("wallpaper"))
+    engine.register_scanner(_FailingScanner("cursor"))
+    progress: list[tuple[str, int]] = []
+
+    result = engine.scan_all(
+        on_progress=lambda scanner, items: progress.append((scanner.category, len(items)))
+    )
+
+    assert sorted(progress) == [("cursor", 0), ("wallpaper", 1)]
+    assert [item.category for item in result.items] == ["wallpaper"]
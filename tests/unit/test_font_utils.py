@@ -1,4 +1,11 @@
-from winstyles.utils.font_utils import identify_opensource, split_font_families
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from winstyles.utils import font_utils
+from winstyles.utils.font_utils import get_font_version, identify_opensource, split_font_families
 
 
 def test_split_font_families_filters_generic_families() -> None:
@@ -14,3 +21,31 @@ def test_identify_opensource_matches_known_font() -> None:
 
 def test_identify_opensource_returns_none_for_unknown_font() -> None:
     assert identify_opensource("This Font Should Not Exist 12345") is None
+
+
+def test_get_font_version_is_cached_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads: list[Path] = []
+
+    record = SimpleNamespace(nameID=5, platformID=3, toUnicode=lambda: "Version 1.00")
+
+    def fake_loader(path: Path) -> dict[str, Any]:
+        loads.append(path)
+        return {"name": SimpleNamespace(names=[record])}
+
+    monkeypatch.setattr(font_utils, "_TTFONT_LOADER", fake_loader)
+    font_utils._read_font_version.cache_clear()
+    font_file = tmp_path / "Hack.ttf"
+    font_file.write_bytes(b"v1")
+
+    assert get_font_version(font_file) == "Version 1.00"
+    assert get_font_version(font_file) == "Version 1.00"
+    assert len(loads) == 1
+
+    font_file.write_bytes(b"v2-longer")
+
+    assert get_font_version(font_file) == "Version 1.00"
+    assert len(loads) == 2
+    assert get_font_version(tmp_path / "missing.ttf") is None
+    font_utils._read_font_version.cache_clear()
@@ -0,0 +1,254 @@
+import fnmatch
+import threading
+
+import pytest
+
+from winstyles.core import report
+from winstyles.core.report import ReportGenerator
+from winstyles.core.update_checker import UpdateInfo
+from winstyles.domain.models import OpenSourceFontInfo, ScannedItem, ScanResult
+from winstyles.domain.types import ChangeType, SourceType
+
+
+def _generator(fonts: list[OpenSourceFontInfo]) -> ReportGenerator:
+    generator = ReportGenerator(ScanResult(), check_updates=False)
+    generator._font_db = fonts
+    generator._font_pattern = ReportGenerator._compile_font_patterns(fonts)
+    return generator
+
+
+def test_match_font_agrees_with_case_insensitive_fnmatch_first_hit() -> None:
+    fonts = [
+        OpenSourceFontInfo(name="Maple Mono", patterns=["Maple Mono*", "MapleMono*"]),
+        OpenSourceFontInfo(name="Empty", patterns=[]),
+        OpenSourceFontInfo(name="Nerd Fonts", patterns=["*Nerd Font*", "*NF"]),
+        OpenSourceFontInfo(name="Hack", patterns=["Hack*"]),
+    ]
+    generator = _generator(fonts)
+
+    names = ["Maple Mono NF", "Hack Nerd Font", "hack nerd font", "MAPLEMONO", "Consolas nf"]
+    for name in [*names, "Hack", "Segoe UI", ""]:
+        expected = next(
+            (
+                font
+                for font in fonts
+                if any(
+                    fnmatch.fnmatchcase(name.lower(), pattern.lower()) for pattern in font.patterns
+                )
+            ),
+            None,
+        )
+        assert generator._match_font(name) is expected
+
+
+def test_match_font_without_patterns_returns_none() -> None:
+    generator = _generator([OpenSourceFontInfo(name="Empty", patterns=[])])
+
+    assert generator._font_pattern is None
+    assert generator._match_font("Anything") is None
+
+
+def test_classify_changes_matches_each_distinct_value_once() -> None:
+    hack = OpenSourceFontInfo(name="Hack", patterns=["Hack*"])
+    items = [
+        ScannedItem(
+            category="fonts",
+            key=f"fonts.face{index}",
+            current_value=value,
+            source_type=SourceType.REGISTRY,
+            source_path="HKCU\\Fonts",
+        )
+        for index, value in enumerate(["Hack", "Segoe UI", "Hack", "Segoe UI"])
+    ]
+    generator = _generator([hack])
+    generator.scan_result = ScanResult(items=items)
+    calls: list[str] = []
+    pattern = generator._font_pattern
+    assert pattern is not None
+
+    class _CountingPattern:
+        def match(self, name: str):  # type: ignore[no-untyped-def]
+            calls.append(name)
+            return pattern.match(name)
+
+    generator._font_pattern = _CountingPattern()  # type: ignore[assignment]
+
+    classified = generator.classify_changes()
+
+    assert len(calls) == 2
+    assert [font.name for _, font, _ in classified.detected_fonts] == ["Hack", "Hack"]
+
+
+def test_user_customization_requires_custom_key_and_non_default_font() -> None:
+    generator = _generator([])
+
+    def item(key: str, value: str) -> ScannedItem:
+        return ScannedItem(
+            category="terminal",
+            key=key,
+            current_value=value,
+            source_type=SourceType.FILE,
+            source_path="settings.json",
+        )
+
+    custom = item("windowsTerminal.defaults.font.face", "Iosevka")
+    system_font = item("windowsTerminal.defaults.font.face", "Cascadia Mono")
+    other_key = item("windowsTerminal.defaults.opacity", "Iosevka")
+
+    assert generator._is_user_customization(custom, "Iosevka", None)
+    assert not generator._is_user_customization(system_font, "Cascadia Mono", None)
+    assert not generator._is_user_customization(other_key, "Iosevka", None)
+
+
+def test_markdown_summary_counts_each_classification_per_category() -> None:
+    def item(category: str, key: str, value: str, source_path: str) -> ScannedItem:
+        return ScannedItem(
+            category=category,
+            key=key,
+            current_value=value,
+            change_type=ChangeType.DEFAULT,
+            source_type=SourceType.REGISTRY,
+            source_path=source_path,
+        )
+
+    generator = _generator([])
+    generator.scan_result = ScanResult(
+        items=[
+            item("theme", "theme.accentColor", "#FF0000", "HKCU"),
+            item("theme", "theme.mode", "dark", "HKCU"),
+            item("fonts", "fonts.link", "x", "HKLM\\FontLink"),
+            item("fonts", "wallpaper.path", "C:\\bg.jpg", "HKCU"),
+        ]
+    )
+
+    markdown = generator.generate_markdown()
+
+    assert "| fonts | 1 | 1 | 0 |" in markdown
+    assert "| theme | 1 | 0 | 1 |" in markdown
+
+
+def test_inline_markdown_renders_links_bold_code_and_italics() -> None:
+    generator = _generator([])
+
+    html = generator._inline_md("[主页](https://x.dev) **粗** `code` *斜*")
+
+    assert html == (
+        '<a href="https://x.dev">主页</a> <strong>粗</strong> <code>code</code> <em>斜</em>'
+    )
+
+
+def test_font_update_checks_run_once_per_name_and_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    hack = OpenSourceFontInfo(name="Hack", patterns=["Hack*"])
+    values = ["Hack", "Hack Nerd Font", "Hack"]
+    generator = _generator([hack])
+    generator.check_updates = True
+    generator.scan_result = ScanResult(
+        items=[
+            ScannedItem(
+                category="fonts",
+                key=f"fonts.face{index}",
+                current_value=value,
+                source_type=SourceType.REGISTRY,
+                source_path="HKCU\\Fonts",
+            )
+            for index, value in enumerate(values)
+        ]
+    )
+    monkeypatch.setattr(report, "find_font_path", lambda name: None)
+    barrier = threading.Barrier(2, timeout=5)
+    checked: list[str | None] = []
+
+    def fake_check(font_info: OpenSourceFontInfo, local_version: str | None) -> UpdateInfo:
+        # 两个不同名称的检查必须同时进行才能通过屏障
+        barrier.wait()
+        checked.append(local_version)
+        return UpdateInfo("1.0", "2.0", "https://example.invalid", True)
+
+    monkeypatch.setattr(generator.update_checker, "check_font_update", fake_check)
+
+    classified = generator.classify_changes()
+
+    assert len(checked) == 2
+    assert [item.current_value for item, _, _ in classified.detected_fonts] == values
+    assert all(update is not None for _, _, update in classified.detected_fonts)
+
+
+def test_local_font_version_is_resolved_once_per_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    def fake_find(name: str) -> str:
+        lookups.append(name)
+        return f"C:\\Fonts\\{name}.ttf"
+
+    monkeypatch.setattr(report, "find_font_path", fake_find)
+    monkeypatch.setattr(report, "get_font_version", lambda path: "Version 1.0")
+    generator = _generator([])
+
+    assert generator._local_font_version("Hack") == "Version 1.0"
+    assert generator._local_font_version("Hack") == "Version 1.0"
+    assert lookups == ["Hack"]
+
+
+def test_markdown_to_html_uses_th_only_for_each_table_header_row() -> None:
+    generator = _generator([])
+    md = "\n".join(
+        ["| A | B |", "|---|---|", "| 1 | 2 |", "| 3 | 4 |", "", "| C |", "|---|", "| 5 |"]
+    )
+
+    html = generator._markdown_to_html(md)
+
+    assert html.count("<table>") == 2
+    assert html.count("<th>") == 3
+    assert html.count("<td>") == 5
+
+
+def test_font_db_and_update_checker_load_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    fetched: list[bool] = []
+    monkeypatch.setattr(
+        report.UpdateChecker, "fetch_remote_db", lambda self: fetched.append(True) or None
+    )
+
+    generator = ReportGenerator(ScanResult(), check_updates=True)
+    generator.generate_markdown()
+
+    assert fetched == []
+    assert "update_checker" not in generator.__dict__
+    assert "_font_db" not in generator.__dict__
+
+    generator._match_font("Hack")
+
+    assert fetched == [True]
+    assert generator._font_db
+
+
+def test_html_after_markdown_reuses_classification(monkeypatch: pytest.MonkeyPatch) -> None:
+    generator = _generator([OpenSourceFontInfo(name="Hack", patterns=["Hack*"])])
+    generator.scan_result = ScanResult(
+        items=[
+            ScannedItem(
+                category="fonts",
+                key="fonts.face",
+                current_value="Hack",
+                source_type=SourceType.REGISTRY,
+                source_path="HKCU\\Fonts",
+            )
+        ]
+    )
+    calls: list[bool] = []
+    original = ReportGenerator.generate_markdown
+
+    def counting_markdown(self: ReportGenerator) -> str:
+        calls.append(self._markdown is None)
+        return original(self)
+
+    monkeypatch.setattr(ReportGenerator, "generate_markdown", counting_markdown)
+
+    markdown = generator.generate_markdown()
+    classified = generator.classify_changes()
+    generator.generate_html()
+
+    assert calls == [True, False]
+    assert generator.generate_markdown() is markdown
+    assert generator.classify_changes() is classified
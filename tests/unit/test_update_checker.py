@@ -0,0 +1,103 @@
+import io
+import os
+import urllib.error
+import urllib.request
+from email.message import Message
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from winstyles.core.context import AppConfig, AppContext
+from winstyles.core.update_checker import UpdateChecker
+
+
+class _Response(io.BytesIO):
+    def __init__(self, body: bytes, headers: dict[str, str]) -> None:
+        super().__init__(body)
+        self.status = 200
+        self.headers = Message()
+        for name, value in headers.items():
+            self.headers[name] = value
+
+
+def test_http_get_revalidates_with_etag_and_serves_cached_body_on_304(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sent: list[dict[str, Any]] = []
+
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> _Response:
+        sent.append(dict(request.header_items()))
+        if request.get_header("If-none-match") == '"v1"':
+            raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+        return _Response(b'{"fonts": []}', {"ETag": '"v1"'})
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    checker = UpdateChecker(cache_dir=tmp_path)
+
+    first = checker._fetch_json("https://example.invalid/db.json")
+    second = checker._fetch_json("https://example.invalid/db.json")
+
+    assert first == second == {"fonts": []}
+    assert "If-none-match" not in sent[0]
+    assert sent[1]["If-none-match"] == '"v1"'
+
+
+def test_fetch_remote_db_refetches_for_each_instance(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def fake_fetch_json(self: UpdateChecker, url: str) -> dict[str, Any] | None:
+        calls.append(url)
+        return {"fonts": [], "version_differences": {}} if url == self.REMOTE_DB_URL else None
+
+    monkeypatch.setattr(UpdateChecker, "_fetch_json", fake_fetch_json)
+    checker = UpdateChecker(cache_dir=tmp_path)
+
+    first = checker.fetch_remote_db()
+    assert checker.fetch_remote_db() is first
+    assert len(calls) == 2
+
+    # 新实例（如 Web UI 的「刷新字体数据库」）总是重新请求，由条件请求保证开销很小
+    UpdateChecker(cache_dir=tmp_path).fetch_remote_db()
+    assert len(calls) == 4
+
+
+def test_write_cache_replaces_files_without_leaving_temp_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    checker = UpdateChecker(cache_dir=tmp_path)
+    body_path, meta_path = checker._cache_paths("https://example.invalid/db.json")
+    checker._write_cache(body_path, meta_path, b"v1", '"v1"', None)
+
+    replaced: list[str] = []
+    real_replace = os.replace
+
+    def fake_replace(src: str, dst: Path) -> None:
+        replaced.append(Path(dst).name)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", fake_replace)
+    checker._write_cache(body_path, meta_path, b"v2", '"v2"', None)
+
+    assert replaced == [body_path.name, meta_path.name]
+    assert body_path.read_bytes() == b"v2"
+    assert checker._read_cache_meta(meta_path) == {"etag": '"v2"', "last_modified": None}
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([body_path.name, meta_path.name])
+
+
+def test_default_cache_dir_is_created_under_app_data_dir(tmp_path: Path) -> None:
+    data_dir = tmp_path / "nested" / ".wss"
+    AppContext.reset()
+    try:
+        AppContext(AppConfig(data_dir=data_dir))
+        checker = UpdateChecker()
+        body_path, meta_path = checker._cache_paths("https://example.invalid/db.json")
+
+        checker._write_cache(body_path, meta_path, b"{}", '"v1"', None)
+
+        assert body_path.parent == data_dir / "http_cache"
+        assert body_path.read_bytes() == b"{}"
+    finally:
+        AppContext.reset()
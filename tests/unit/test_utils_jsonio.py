@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from winstyles.utils import jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_round_trip_keeps_non_ascii(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson and jsonio._orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "_orjson", None)
+
+    payload = {"name": "微软雅黑", "size": 12, "items": [True, None]}
+    data = jsonio.dumps(payload)
+
+    assert "微软雅黑".encode() in data
+    assert jsonio.loads(data) == payload
+    assert json.loads(data) == payload
@@ -38,6 +38,8 @@ a = Analysis(
     datas=[
         # Include frontend files for Web UI
         (os.path.join(project_root, 'frontend'), 'frontend'),
+        # Include Windows defaults database
+        (os.path.join(project_root, 'data', 'defaults'), os.path.join('data', 'defaults')),
         # Include start_web_ui.py
         (os.path.join(project_root, 'start_web_ui.py'), '.'),
     ],